@@ -0,0 +1,66 @@
+"""
+Checks that `import wilson` stays cheap, i.e. resolves its public names lazily
+instead of importing numpy, protobuf, cmasher or the server up front.
+
+Usage: python benchmarks/import_time.py [--budget MS] [--runs N]
+Exits with a non-zero status if a heavy module gets imported or the import
+takes longer than the budget.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# modules only needed once the corresponding public names are accessed
+HEAVY_MODULES = [
+    "numpy",
+    "google.protobuf",
+    "cmasher",
+    "wilson.proto",
+    "wilson.serialize",
+    "wilson.server",
+    "http.server",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import wilson
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measureImport() -> dict:
+    """Imports wilson in a fresh interpreter and returns time and loaded modules"""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    result: dict = json.loads(output)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--budget", type=float, default=50.0, help="Budget in ms")
+    parser.add_argument("--runs", type=int, default=5, help="Takes the best of n runs")
+    args = parser.parse_args()
+
+    results = [measureImport() for _ in range(args.runs)]
+    best = min(r["elapsed"] for r in results) * 1000.0
+    loaded = [m for m in HEAVY_MODULES if m in results[0]["modules"]]
+    print(f"import wilson: {best:.1f} ms (budget {args.budget:.0f} ms)")
+
+    failed = False
+    if loaded:
+        print(f"FAIL: import wilson loaded {', '.join(loaded)}")
+        failed = True
+    if best > args.budget:
+        print("FAIL: import wilson exceeds the budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
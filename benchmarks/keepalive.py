@@ -0,0 +1,98 @@
+"""
+Checks that the built-in server keeps connections alive: loading all files of
+the app repeatedly must reuse a single connection, and must not be slower than
+opening a new connection per request.
+
+Requires the built app (yarn buildpy), as it requests its files.
+
+Usage: python benchmarks/keepalive.py [--engine {threading,asyncio}] [--rounds N]
+Exits with a non-zero status if a connection was not reused.
+"""
+
+import argparse
+import http.client
+import importlib.resources
+import sys
+import time
+from typing import List, Tuple
+from zipfile import ZipFile
+
+from wilson.server import WilsonServer
+
+
+def appFiles() -> List[str]:
+    """Paths of all files in the app"""
+    app = importlib.resources.files("wilson").joinpath("app.zip")  # type: ignore
+    with app.open(mode="rb") as f, ZipFile(f) as archive:
+        names = [n for n in archive.namelist() if not n.endswith("/")]
+    # the viewer is loaded via index.html
+    return ["/"] + [f"/{n}" for n in names if not n.endswith((".gz", ".br"))]
+
+
+class CountingConnection(http.client.HTTPConnection):
+    """Connection counting how often it (re)connects"""
+
+    connects = 0
+
+    def connect(self) -> None:
+        self.connects += 1
+        super().connect()
+
+
+def loadReused(port: int, paths: List[str], rounds: int) -> Tuple[float, int]:
+    """Loads the paths over a single connection. Returns time and connections opened."""
+    connection = CountingConnection("localhost", port)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            connection.request("GET", path, headers={"Accept-Encoding": "gzip"})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"{path} returned {response.status}")
+    elapsed = time.perf_counter() - start
+    connection.close()
+    return elapsed, connection.connects
+
+
+def loadNew(port: int, paths: List[str], rounds: int) -> float:
+    """Loads the paths opening a new connection per request. Returns time."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            connection = http.client.HTTPConnection("localhost", port)
+            connection.request("GET", path, headers={"Accept-Encoding": "gzip"})
+            connection.getresponse().read()
+            connection.close()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--engine", choices=["threading", "asyncio"], default="threading")
+    parser.add_argument("--rounds", type=int, default=20, help="Times to load the app")
+    args = parser.parse_args()
+
+    server = WilsonServer(engine=args.engine)
+    try:
+        paths = appFiles()
+        requests = len(paths) * args.rounds
+        reused, connections = loadReused(server.port, paths, args.rounds)
+        new = loadNew(server.port, paths, args.rounds)
+    finally:
+        server.shutdown()
+
+    print(f"{requests} requests over {connections} connection(s): {reused * 1000:.1f} ms")
+    print(f"{requests} requests over {requests} connections: {new * 1000:.1f} ms")
+    failed = False
+    if connections != 1:
+        print("FAIL: the connection was not kept alive")
+        failed = True
+    if reused > new:
+        print("FAIL: reusing the connection is slower than opening new ones")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Checks that the `wilson` command starts fast: wilson.server must be importable
+without numpy, protobuf, cmasher or the object model, and the time from process
+start to a listening socket must stay within a budget on top of a bare
+interpreter start.
+
+Requires the built app (yarn buildpy), as the server loads it on start. The
+package gets compiled to bytecode first, as an installation would do.
+
+Usage: python benchmarks/startup.py [--budget MS] [--runs N]
+Exits with a non-zero status if any check fails.
+"""
+
+import argparse
+import compileall
+import json
+import os.path
+import socket
+import subprocess
+import sys
+import time
+
+# modules only needed for creating projects, not for serving files
+HEAVY_MODULES = [
+    "numpy",
+    "google.protobuf",
+    "cmasher",
+    "wilson.proto",
+    "wilson.project",
+    "wilson.catalogue",
+    "wilson.serialize",
+]
+
+PROBE = """
+import json, sys
+import wilson.server
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# same as the console script created for the `wilson` command
+CLI = "import sys; from wilson.server import cli_main; sys.exit(cli_main())"
+
+
+def freePort() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def timeToExit(args: list) -> float:
+    """Seconds it takes to run the given interpreter arguments"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], check=True)
+    return time.perf_counter() - start
+
+
+def timeToListen() -> float:
+    """Seconds from starting the cli until it accepts connections"""
+    port = freePort()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", CLI, "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                socket.create_connection(("localhost", port)).close()
+                return time.perf_counter() - start
+            except ConnectionRefusedError:
+                if process.poll() is not None:
+                    raise RuntimeError("The cli exited before listening!")
+                time.sleep(0.001)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--budget", type=float, default=100.0, help="Budget in ms on top of a bare interpreter"
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Takes the best of n runs")
+    args = parser.parse_args()
+
+    # otherwise compiling the sources would be part of the measurement
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "wilson")
+    compileall.compile_dir(root, quiet=1)
+
+    failed = False
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    loaded = [m for m in HEAVY_MODULES if m in json.loads(output)]
+    if loaded:
+        print(f"FAIL: import wilson.server loaded {', '.join(loaded)}")
+        failed = True
+
+    bare = min(timeToExit(["-c", "pass"]) for _ in range(args.runs)) * 1000.0
+    listen = min(timeToListen() for _ in range(args.runs)) * 1000.0
+    print(f"bare interpreter: {bare:.1f} ms")
+    print(f"cli listening:    {listen:.1f} ms (budget {bare + args.budget:.0f} ms)")
+    if listen > bare + args.budget:
+        print("FAIL: the cli exceeds its startup budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ export interface Graph {
   points: Graph_Point[];
   /** interpolation mode */
   interpolation: Interpolation;
+  /** interpolation points as packed columns; alternative to points
+   * time coordinates
+   */
+  time: number[];
+  /** values at time */
+  value: number[];
 }
 
 /** Interpolation point */
@@ -25,7 +31,7 @@ export interface Graph_Point {
 }
 
 function createBaseGraph(): Graph {
-  return { name: "", id: 0, points: [], interpolation: 0 };
+  return { name: "", id: 0, points: [], interpolation: 0, time: [], value: [] };
 }
 
 export const Graph = {
@@ -42,6 +48,16 @@ export const Graph = {
     if (message.interpolation !== 0) {
       writer.uint32(32).int32(message.interpolation);
     }
+    writer.uint32(42).fork();
+    for (const v of message.time) {
+      writer.double(v);
+    }
+    writer.ldelim();
+    writer.uint32(50).fork();
+    for (const v of message.value) {
+      writer.double(v);
+    }
+    writer.ldelim();
     return writer;
   },
 
@@ -80,6 +96,40 @@ export const Graph = {
 
           message.interpolation = reader.int32() as any;
           continue;
+        case 5:
+          if (tag === 41) {
+            message.time.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 42) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.time.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        case 6:
+          if (tag === 49) {
+            message.value.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 50) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.value.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -95,6 +145,8 @@ export const Graph = {
       id: isSet(object.id) ? Number(object.id) : 0,
       points: Array.isArray(object?.points) ? object.points.map((e: any) => Graph_Point.fromJSON(e)) : [],
       interpolation: isSet(object.interpolation) ? interpolationFromJSON(object.interpolation) : 0,
+      time: Array.isArray(object?.time) ? object.time.map((e: any) => Number(e)) : [],
+      value: Array.isArray(object?.value) ? object.value.map((e: any) => Number(e)) : [],
     };
   },
 
@@ -112,6 +164,12 @@ export const Graph = {
     if (message.interpolation !== 0) {
       obj.interpolation = interpolationToJSON(message.interpolation);
     }
+    if (message.time?.length) {
+      obj.time = message.time;
+    }
+    if (message.value?.length) {
+      obj.value = message.value;
+    }
     return obj;
   },
 
@@ -125,6 +183,8 @@ export const Graph = {
     message.id = object.id ?? 0;
     message.points = object.points?.map((e) => Graph_Point.fromPartial(e)) || [];
     message.interpolation = object.interpolation ?? 0;
+    message.time = object.time?.map((e) => e) || [];
+    message.value = object.value?.map((e) => e) || [];
     return message;
   },
 };
@@ -15,6 +15,16 @@ export interface Path {
   points: Path_Point[];
   /** interpolation mode */
   interpolation: Interpolation;
+  /** interpolation points as packed columns; alternative to points
+   * time coordinates
+   */
+  time: number[];
+  /** x coordinates of positions */
+  x: number[];
+  /** y coordinates of positions */
+  y: number[];
+  /** z coordinates of positions */
+  z: number[];
 }
 
 /** Interpolation point */
@@ -26,7 +36,7 @@ export interface Path_Point {
 }
 
 function createBasePath(): Path {
-  return { name: "", id: 0, points: [], interpolation: 0 };
+  return { name: "", id: 0, points: [], interpolation: 0, time: [], x: [], y: [], z: [] };
 }
 
 export const Path = {
@@ -43,6 +53,26 @@ export const Path = {
     if (message.interpolation !== 0) {
       writer.uint32(32).int32(message.interpolation);
     }
+    writer.uint32(42).fork();
+    for (const v of message.time) {
+      writer.double(v);
+    }
+    writer.ldelim();
+    writer.uint32(50).fork();
+    for (const v of message.x) {
+      writer.double(v);
+    }
+    writer.ldelim();
+    writer.uint32(58).fork();
+    for (const v of message.y) {
+      writer.double(v);
+    }
+    writer.ldelim();
+    writer.uint32(66).fork();
+    for (const v of message.z) {
+      writer.double(v);
+    }
+    writer.ldelim();
     return writer;
   },
 
@@ -81,6 +111,74 @@ export const Path = {
 
           message.interpolation = reader.int32() as any;
           continue;
+        case 5:
+          if (tag === 41) {
+            message.time.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 42) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.time.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        case 6:
+          if (tag === 49) {
+            message.x.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 50) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.x.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        case 7:
+          if (tag === 57) {
+            message.y.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 58) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.y.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        case 8:
+          if (tag === 65) {
+            message.z.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 66) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.z.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -96,6 +194,10 @@ export const Path = {
       id: isSet(object.id) ? Number(object.id) : 0,
       points: Array.isArray(object?.points) ? object.points.map((e: any) => Path_Point.fromJSON(e)) : [],
       interpolation: isSet(object.interpolation) ? interpolationFromJSON(object.interpolation) : 0,
+      time: Array.isArray(object?.time) ? object.time.map((e: any) => Number(e)) : [],
+      x: Array.isArray(object?.x) ? object.x.map((e: any) => Number(e)) : [],
+      y: Array.isArray(object?.y) ? object.y.map((e: any) => Number(e)) : [],
+      z: Array.isArray(object?.z) ? object.z.map((e: any) => Number(e)) : [],
     };
   },
 
@@ -113,6 +215,18 @@ export const Path = {
     if (message.interpolation !== 0) {
       obj.interpolation = interpolationToJSON(message.interpolation);
     }
+    if (message.time?.length) {
+      obj.time = message.time;
+    }
+    if (message.x?.length) {
+      obj.x = message.x;
+    }
+    if (message.y?.length) {
+      obj.y = message.y;
+    }
+    if (message.z?.length) {
+      obj.z = message.z;
+    }
     return obj;
   },
 
@@ -126,6 +240,10 @@ export const Path = {
     message.id = object.id ?? 0;
     message.points = object.points?.map((e) => Path_Point.fromPartial(e)) || [];
     message.interpolation = object.interpolation ?? 0;
+    message.time = object.time?.map((e) => e) || [];
+    message.x = object.x?.map((e) => e) || [];
+    message.y = object.y?.map((e) => e) || [];
+    message.z = object.z?.map((e) => e) || [];
     return message;
   },
 };
@@ -1,4 +1,5 @@
 import { Project } from "../../model/project";
+import { unpackProject } from "../../util/packed";
 import { LocalController } from "../controller/local";
 import { WorkerCommand } from "./command";
 import { AnimationLoopEvent, FrameChangedEvent, ObjectPickedEvent } from "./event";
@@ -13,7 +14,7 @@ function messageHandler(ev: MessageEvent<WorkerCommand>) {
             //decode project
             const serialized: ArrayBufferLike = ev.data.data;
             const data = new Uint8Array(serialized);
-            const project: Project = Project.decode(data);
+            const project: Project = unpackProject(Project.decode(data));
             //load it
             controller.load(project);
         }
@@ -1,6 +1,7 @@
 import { defineStore } from "pinia";
 import { Animatible } from "../model/animatible";
 import { Project } from "../model/project";
+import { unpackProject } from "../util/packed";
 
 export const useProject = defineStore("project", {
     state: (): Project => ({
@@ -31,7 +32,7 @@ export const useProject = defineStore("project", {
     },
     actions: {
         loadProject(data: Uint8Array) {
-            const project = Project.decode(data);
+            const project = unpackProject(Project.decode(data));
             this.$patch(project);
         },
         /**
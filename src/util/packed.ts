@@ -0,0 +1,33 @@
+import { Project } from "../model/project";
+
+/**
+ * Converts graphs and paths stored as packed columns into points in place, so
+ * the rest of the app only needs to handle the latter. Points given by columns
+ * are appended to the ones stored as messages.
+ * @param project Project to convert
+ * @returns The given project
+ */
+export function unpackProject(project: Project): Project {
+    for (const graph of project.graphs) {
+        const n = Math.min(graph.time.length, graph.value.length);
+        for (let i = 0; i < n; ++i) {
+            graph.points.push({ time: graph.time[i], value: graph.value[i] });
+        }
+        graph.time = [];
+        graph.value = [];
+    }
+    for (const path of project.paths) {
+        const n = Math.min(path.time.length, path.x.length, path.y.length, path.z.length);
+        for (let i = 0; i < n; ++i) {
+            path.points.push({
+                time: path.time[i],
+                position: { x: path.x[i], y: path.y[i], z: path.z[i] }
+            });
+        }
+        path.time = [];
+        path.x = [];
+        path.y = [];
+        path.z = [];
+    }
+    return project;
+}
@@ -1,10 +1,58 @@
-from wilson.color import getColorByName, getColorByRGBA
-from wilson.data import Interpolation, Graph, Path, Text
-from wilson.objects import Animatable, Line, Prism, Sphere, Tube, UnknownAnimatible, Overlay
-from wilson.project import Camera, Project
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-from wilson.catalogue import Catalogue, openProject, saveProject
-from wilson.parse import ProjectParserException, parseProjectFromBytes
-from wilson.serialize import serializeProject
+if TYPE_CHECKING:
+    from wilson.color import getColorByName, getColorByRGBA
+    from wilson.data import Interpolation, Graph, Path, Text
+    from wilson.objects import Animatable, Line, Prism, Sphere, Tube, UnknownAnimatible, Overlay
+    from wilson.project import Camera, Project
 
-from wilson.server import WilsonServer
+    from wilson.catalogue import Catalogue, openProject, saveProject
+    from wilson.parse import ProjectParserException, parseProjectFromBytes
+    from wilson.serialize import SerializationCache, serializeProject, writeProject
+
+    from wilson.server import WilsonServer
+
+# Public names mapped to the module defining them. Modules are only imported once
+# one of their names is accessed to keep importing wilson itself fast.
+_exports = {
+    "getColorByName": "wilson.color",
+    "getColorByRGBA": "wilson.color",
+    "Interpolation": "wilson.data",
+    "Graph": "wilson.data",
+    "Path": "wilson.data",
+    "Text": "wilson.data",
+    "Animatable": "wilson.objects",
+    "Line": "wilson.objects",
+    "Prism": "wilson.objects",
+    "Sphere": "wilson.objects",
+    "Tube": "wilson.objects",
+    "UnknownAnimatible": "wilson.objects",
+    "Overlay": "wilson.objects",
+    "Camera": "wilson.project",
+    "Project": "wilson.project",
+    "Catalogue": "wilson.catalogue",
+    "openProject": "wilson.catalogue",
+    "saveProject": "wilson.catalogue",
+    "ProjectParserException": "wilson.parse",
+    "parseProjectFromBytes": "wilson.parse",
+    "SerializationCache": "wilson.serialize",
+    "serializeProject": "wilson.serialize",
+    "writeProject": "wilson.serialize",
+    "WilsonServer": "wilson.server",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_exports[name]), name)
+    # cache it so subsequent lookups do not end up here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,295 @@
+from __future__ import annotations
+import asyncio
+import http.client
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from http import HTTPStatus
+from typing import List, Optional, Sequence, Set, Tuple
+
+from wilson.server import BadResponse, Body, EventStream, FileRange, Handler, Response
+
+
+class _AsyncRequest:
+    """Parsed request passed to the handler stages"""
+
+    def __init__(self, path: str, headers: Message) -> None:
+        self.path = path
+        self.headers = headers
+
+
+class AsyncHTTPServer:
+    """HTTP/1.1 server running on an asyncio event loop serving the given stages.
+
+    Alternative to ThreadingHTTPServer, that serves all connections from a
+    single thread instead of one per connection, and limits the number of
+    connections served at once. The handler stages might block on the file
+    system, e.g. reading catalogues, thus they run on a small pool of threads,
+    while the event loop only does the networking. It provides the same
+    interface used by WilsonServer, i.e. serve_forever, shutdown and
+    server_close.
+
+    Parameters
+    ----------
+    address: Tuple[str, int]
+        Host and port to listen on. If the port is zero, the OS will provide a
+        random free one.
+    stages: Sequence[Handler]
+        Handlers asked in order to answer a request
+    maxConnections: int, default=256
+        Maximum number of connections served at once. Further requests wait
+        until one has been answered. Connections idling between requests or
+        streaming events do not count towards the limit.
+    quiet: bool, default=False
+        If True, suppresses logging requests to stderr.
+    """
+
+    # close idle connections after some time
+    timeout = 30
+    # upper limit of the request line and headers
+    maxHeaderSize = 65536
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        stages: Sequence[Handler],
+        *,
+        maxConnections: int = 256,
+        quiet: bool = False,
+    ) -> None:
+        self._stages = stages
+        self._quiet = quiet
+        self._loop = asyncio.new_event_loop()
+        self._stopped = threading.Event()
+        self._stopped.set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._executor = ThreadPoolExecutor(thread_name_prefix="wilson-stage")
+        self._server = self._loop.run_until_complete(self._start(address, maxConnections))
+
+    async def _start(self, address: Tuple[str, int], maxConnections: int) -> asyncio.Server:
+        # create the semaphore inside the loop it is used in
+        self._limit = asyncio.Semaphore(maxConnections)
+        return await asyncio.start_server(
+            self._serve, address[0], address[1], limit=self.maxHeaderSize
+        )
+
+    @property
+    def server_port(self) -> int:
+        """Port the server is listening on"""
+        port: int = self._server.sockets[0].getsockname()[1]
+        return port
+
+    def serve_forever(self) -> None:
+        """Serves requests until shutdown is called"""
+        self._stopped.clear()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        """Stops serve_forever and waits until it returned. Must be called from
+        another thread."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._stopped.wait()
+
+    def server_close(self) -> None:
+        """Closes all connections and the listening socket"""
+        if self._loop.is_closed():
+            return
+        self._loop.run_until_complete(self._close())
+        self._loop.close()
+        self._executor.shutdown()
+
+    async def _close(self) -> None:
+        self._server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(self._server.wait_closed(), *self._tasks, return_exceptions=True)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        try:
+            while await self._handleRequest(reader, writer):
+                pass
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            # client went away or idled too long
+            pass
+        except asyncio.CancelledError:
+            # server is shutting down
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._tasks.discard(task)
+
+    async def _handleRequest(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        # returns True if the connection should be kept alive
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.timeout)
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise
+            # connection closed between requests
+            return False
+        except asyncio.LimitOverrunError:
+            await self._sendError(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+            return False
+
+        requestLine, _, rest = head.partition(b"\r\n")
+        words = requestLine.decode("iso-8859-1").split()
+        if len(words) != 3 or not words[2].startswith("HTTP/"):
+            await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+            return False
+        method, path, version = words
+        # same as BaseHTTPRequestHandler: '//' would be a scheme relative url
+        if path.startswith("//"):
+            path = "/" + path.lstrip("/")
+        try:
+            headers = http.client.parse_headers(io.BytesIO(rest))
+        except http.client.HTTPException:
+            await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+            return False
+
+        # HTTP/1.1 keeps connections alive unless told otherwise, HTTP/1.0 the opposite
+        connection = headers.get("Connection", "").lower()
+        if version == "HTTP/1.1":
+            keepAlive = connection != "close"
+        else:
+            keepAlive = connection == "keep-alive"
+
+        # skip request body, if any
+        length = headers.get("Content-Length")
+        if length is not None:
+            try:
+                await reader.readexactly(int(length))
+            except ValueError:
+                await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+                return False
+
+        if method not in ("GET", "HEAD"):
+            await self._sendError(writer, HTTPStatus.NOT_IMPLEMENTED)
+            return False
+
+        request = _AsyncRequest(path, headers)
+        # only take a slot while answering, i.e. not while idling between requests
+        async with self._limit:
+            # stages and prepare might block -> keep them off the event loop
+            response, (status, responseHeaders, body) = await self._loop.run_in_executor(
+                self._executor, self._prepare, request
+            )
+            try:
+                if isinstance(body, EventStream):
+                    # the stream only ends with the connection
+                    keepAlive = False
+                if not keepAlive:
+                    responseHeaders.append(("Connection", "close"))
+                writer.write(self._encodeHead(status, responseHeaders))
+                if method != "HEAD":
+                    if isinstance(body, FileRange):
+                        writer.write(body.header)
+                        if body.length > 0:
+                            await writer.drain()
+                            # copies the file directly into the socket, if supported
+                            await self._loop.sendfile(
+                                writer.transport, body.file, body.offset, body.length
+                            )
+                        writer.write(body.trailer)
+                    elif not isinstance(body, EventStream):
+                        writer.write(body)
+                await writer.drain()
+            except BaseException:
+                response.close()
+                raise
+        # streams idle most of the time -> release the slot before streaming
+        try:
+            if method != "HEAD" and isinstance(body, EventStream):
+                await self._stream(writer, body)
+        finally:
+            response.close()
+
+        self._log(requestLine.decode("iso-8859-1"), status, writer)
+        return keepAlive
+
+    async def _stream(self, writer: asyncio.StreamWriter, stream: EventStream) -> None:
+        wake = asyncio.Event()
+
+        def notify() -> None:
+            # called from the thread pushing the events
+            try:
+                self._loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                # loop already closed
+                pass
+
+        stream.subscribe(notify)
+        try:
+            while True:
+                data = stream.poll()
+                if data is None:
+                    try:
+                        await asyncio.wait_for(wake.wait(), EventStream.HEARTBEAT_INTERVAL)
+                    except asyncio.TimeoutError:
+                        data = EventStream.HEARTBEAT
+                    wake.clear()
+                    if data is None:
+                        continue
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        finally:
+            stream.unsubscribe(notify)
+
+    def _createResponse(self, request: _AsyncRequest) -> Response:
+        for stage in self._stages:
+            response = stage(request)
+            if response is not None:
+                return response
+        # not found
+        return BadResponse()
+
+    def _prepare(
+        self, request: _AsyncRequest
+    ) -> Tuple[Response, Tuple[int, List[Tuple[str, str]], Body]]:
+        # runs on the executor
+        response = self._createResponse(request)
+        try:
+            return response, response.prepare(request)
+        except BaseException:
+            response.close()
+            raise
+
+    @staticmethod
+    def _encodeHead(status: int, headers: List[Tuple[str, str]]) -> bytes:
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines.append(f"Date: {time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime())}")
+        lines.extend(f"{name}: {value}" for name, value in headers)
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", "strict")
+
+    async def _sendError(self, writer: asyncio.StreamWriter, status: HTTPStatus) -> None:
+        content = f"{status.value} {status.phrase}".encode()
+        headers = [
+            ("Content-Length", str(len(content))),
+            ("Content-Type", "text/plain"),
+            ("Connection", "close"),
+        ]
+        writer.write(self._encodeHead(status, headers) + content)
+        await writer.drain()
+        self._log("-", status, writer)
+
+    def _log(self, requestLine: str, status: int, writer: asyncio.StreamWriter) -> None:
+        # same format as BaseHTTPRequestHandler
+        if self._quiet:
+            return
+        peer: Optional[Tuple[str, int]] = writer.get_extra_info("peername")
+        host = peer[0] if peer is not None else "-"
+        date = time.strftime("%d/%b/%Y %H:%M:%S")
+        sys.stderr.write(f'{host} - - [{date}] "{requestLine}" {int(status)} -\n')
@@ -1,9 +1,13 @@
 from __future__ import annotations
-from typing import IO, List, Literal, Union
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import IO, Deque, Iterable, List, Literal, Optional, Tuple, Union
 from zipfile import ZipFile, ZIP_DEFLATED
 
 from wilson.project import Project
-from wilson.serialize import serializeProject
+from wilson.serialize import serializeProject, writeProject
 from wilson.parse import parseProjectFromBytes
 
 
@@ -41,22 +45,75 @@ class Catalogue:
         """Opens the given entry in the catalogue and returns the parsed project."""
         return parseProjectFromBytes(self._archive.read(name))
 
-    def save(self, name: str, project: Project) -> None:
+    def save(
+        self, name: str, project: Project, *, packed: bool = False, deduplicate: bool = False
+    ) -> None:
         """Serializes the given project and saves it under the given name in the
-        catalogue
+        catalogue. See serializeProject for the meaning of packed and deduplicate.
+        """
+        # stream into the archive to not hold the whole serialized project in memory
+        # size is not known in advance and might exceed the 2 GiB zip limit
+        with self._archive.open(name, "w", force_zip64=True) as file:
+            writeProject(project, file, packed=packed, deduplicate=deduplicate)
+
+    def saveMany(
+        self,
+        items: Iterable[Tuple[str, Project]],
+        *,
+        workers: Optional[int] = None,
+        packed: bool = False,
+        deduplicate: bool = False,
+    ) -> None:
+        """Serializes the given projects using a pool of worker processes and
+        saves them in the given order under their names in the catalogue. See
+        serializeProject for the meaning of packed and deduplicate.
+
+        Parameters
+        ----------
+        items: Iterable[Tuple[str, Project]]
+            Pairs of name and project to save. Consumed lazily, thus it can be a
+            generator creating the projects on the fly.
+        workers: {int, None}, default=None
+            Number of worker processes. Uses the number of CPUs if None. If 1,
+            the projects are serialized on the calling thread.
         """
-        self._archive.writestr(name, serializeProject(project))
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1:
+            for name, project in items:
+                self.save(name, project, packed=packed, deduplicate=deduplicate)
+            return
+
+        serialize = partial(serializeProject, packed=packed, deduplicate=deduplicate)
+        with ProcessPoolExecutor(workers) as pool:
+            # limit the number of projects in flight to bound memory usage
+            pending: Deque[Tuple[str, Future[bytes]]] = deque()
+            for name, project in items:
+                if len(pending) >= 2 * workers:
+                    self._writeFirst(pending)
+                pending.append((name, pool.submit(serialize, project)))
+            while pending:
+                self._writeFirst(pending)
+
+    def _writeFirst(self, pending: Deque[Tuple[str, Future[bytes]]]) -> None:
+        name, data = pending.popleft()
+        # same kind of entry as save() creates, so the archive does not depend on workers
+        with self._archive.open(name, "w", force_zip64=True) as file:
+            file.write(data.result())
 
     def close(self) -> None:
         """Close the file, and for mode 'w', 'x' and 'a' write the ending records."""
         self._archive.close()
 
 
-def saveProject(project: Project, path: str) -> None:
+def saveProject(
+    project: Project, path: str, *, packed: bool = False, deduplicate: bool = False
+) -> None:
     """Saves the given project under the specified path by creating a catalogue
-    with only one entry."""
+    with only one entry. See serializeProject for the meaning of packed and
+    deduplicate."""
     with Catalogue(path, "w") as cat:
-        cat.save("project", project)
+        cat.save("project", project, packed=packed, deduplicate=deduplicate)
 
 
 def openProject(path: str) -> Project:
@@ -1,8 +1,48 @@
 from __future__ import annotations
+import hashlib
 import numpy as np
 from enum import Enum
 from numpy.typing import ArrayLike
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+
+def _digest(name: str, array: ArrayLike) -> bytes:
+    # negative zero compares equal to zero -> add zero to normalize it
+    a = np.ascontiguousarray(array, dtype=np.float64) + 0.0
+    h = hashlib.blake2b(repr((name, a.shape)).encode(), digest_size=16)
+    h.update(a.data)
+    return h.digest()
+
+
+class DataStats(NamedTuple):
+    """Statistics of the control points of a graph or path. Empty tables span
+    the empty range from inf to -inf and count as sorted."""
+
+    startTime: float
+    """Smallest time value"""
+    endTime: float
+    """Largest time value"""
+    minValue: float
+    """Smallest value, i.e. of all coordinates for paths"""
+    maxValue: float
+    """Largest value, i.e. of all coordinates for paths"""
+    sorted: bool
+    """True, if the control points are sorted by time"""
+
+
+def _stats(array: ArrayLike) -> DataStats:
+    a = np.asarray(array, dtype=np.float64)
+    if len(a) == 0:
+        return DataStats(float("inf"), float("-inf"), float("inf"), float("-inf"), True)
+    lo, hi = a.min(axis=0), a.max(axis=0)
+    t = a[:, 0]
+    return DataStats(
+        float(lo[0]),
+        float(hi[0]),
+        float(lo[1:].min()),
+        float(hi[1:].max()),
+        bool(np.all(t[1:] >= t[:-1])),
+    )
 
 
 class Interpolation(Enum):
@@ -38,6 +78,7 @@ class Graph:
     def __init__(
         self, array: ArrayLike, name: str = "", interpolation: Interpolation = Interpolation.LINEAR
     ):
+        self._version = 0
         self.array = array
         self.name = name
         self.interpolation = interpolation
@@ -53,6 +94,8 @@ class Graph:
         if len(shape) != 2 or shape[1] != 2:
             raise ValueError("The array must be of shape (N,2)!")
         self._array = value
+        self._digest: Optional[bytes] = None
+        self._version += 1
 
     @property
     def name(self) -> str:
@@ -62,6 +105,8 @@ class Graph:
     @name.setter
     def name(self, value: str) -> None:
         self._name = str(value)
+        self._digest = None
+        self._version += 1
 
     @property
     def interpolation(self) -> Interpolation:
@@ -71,6 +116,33 @@ class Graph:
     @interpolation.setter
     def interpolation(self, value: Interpolation) -> None:
         self._interpolation = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time a property of the graph is assigned. Changes
+        made in place are not reflected.
+        """
+        return self._version
+
+    @property
+    def stats(self) -> DataStats:
+        """
+        Time and value range of the control points and whether they are sorted.
+        Computed on each access, thus reflects changes made to the array in place.
+        """
+        return _stats(self.array)
+
+    @property
+    def digest(self) -> bytes:
+        """
+        Hash of name and control points. Equal graphs have the same digest. It
+        is cached, thus changes to the array made in place are not reflected.
+        """
+        if self._digest is None:
+            self._digest = _digest(self.name, self.array)
+        return self._digest
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -106,6 +178,7 @@ class Path:
     def __init__(
         self, array: ArrayLike, name: str = "", interpolation: Interpolation = Interpolation.LINEAR
     ):
+        self._version = 0
         self.array = array
         self.name = name
         self.interpolation = interpolation
@@ -121,6 +194,8 @@ class Path:
         if len(shape) != 2 or shape[1] != 4:
             raise ValueError("The array must be of shape (N,4)!")
         self._array = value
+        self._digest: Optional[bytes] = None
+        self._version += 1
 
     @property
     def name(self) -> str:
@@ -130,6 +205,8 @@ class Path:
     @name.setter
     def name(self, value: str) -> None:
         self._name = str(value)
+        self._digest = None
+        self._version += 1
 
     @property
     def interpolation(self) -> Interpolation:
@@ -139,6 +216,33 @@ class Path:
     @interpolation.setter
     def interpolation(self, value: Interpolation) -> None:
         self._interpolation = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time a property of the path is assigned. Changes
+        made in place are not reflected.
+        """
+        return self._version
+
+    @property
+    def stats(self) -> DataStats:
+        """
+        Time and value range of the control points and whether they are sorted.
+        Computed on each access, thus reflects changes made to the array in place.
+        """
+        return _stats(self.array)
+
+    @property
+    def digest(self) -> bytes:
+        """
+        Hash of name and control points. Equal paths have the same digest. It
+        is cached, thus changes to the array made in place are not reflected.
+        """
+        if self._digest is None:
+            self._digest = _digest(self.name, self.array)
+        return self._digest
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -175,6 +279,7 @@ class Text:
     def __init__(
         self, content: str = "", *, graphs: Iterable[GraphLike] = [], paths: Iterable[PathLike] = []
     ):
+        self._version = 0
         self.content = content
         self.graphs = graphs  # type: ignore[assignment]
         self.paths = paths  # type: ignore[assignment]
@@ -187,10 +292,12 @@ class Text:
     @content.setter
     def content(self, value: str) -> None:
         self._content = value
+        self._version += 1
 
     @content.deleter
     def content(self) -> None:
         self._content = ""
+        self._version += 1
 
     @property
     def graphs(self) -> List[GraphLike]:
@@ -200,10 +307,12 @@ class Text:
     @graphs.setter
     def graphs(self, value: Iterable[GraphLike]) -> None:
         self._graphs = list(value)
+        self._version += 1
 
     @graphs.deleter
     def graphs(self) -> None:
         self._graphs = []
+        self._version += 1
 
     @property
     def paths(self) -> List[PathLike]:
@@ -213,10 +322,20 @@ class Text:
     @paths.setter
     def paths(self, value: Iterable[PathLike]) -> None:
         self._paths = list(value)
+        self._version += 1
 
     @paths.deleter
     def paths(self) -> None:
         self._paths = []
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time a property of the text is assigned. Changes
+        made in place are not reflected.
+        """
+        return self._version
 
 
 TextLike = Union[str, Text]
@@ -25,6 +25,7 @@ class Animatable(ABC):
         groups: Iterable[str] = [],
         description: Optional[TextLike] = None,
     ):
+        self._version = 0
         self.name = name
         self.groups = groups  # type: ignore[assignment]
         self.description = description
@@ -37,10 +38,12 @@ class Animatable(ABC):
     @name.setter
     def name(self, value: Optional[str]) -> None:
         self._name = value
+        self._version += 1
 
     @name.deleter
     def name(self) -> None:
         self._name = None
+        self._version += 1
 
     @property
     def groups(self) -> List[str]:
@@ -50,10 +53,12 @@ class Animatable(ABC):
     @groups.setter
     def groups(self, value: Iterable[str]) -> None:
         self._group = list(value)
+        self._version += 1
 
     @groups.deleter
     def groups(self) -> None:
         self._group = []
+        self._version += 1
 
     @property
     def description(self) -> Optional[TextLike]:
@@ -63,10 +68,20 @@ class Animatable(ABC):
     @description.setter
     def description(self, value: Optional[TextLike]) -> None:
         self._description = value
+        self._version += 1
 
     @description.deleter
     def description(self) -> None:
         self._description = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time a property of the object is assigned. Changes
+        made in place are not reflected.
+        """
+        return self._version
 
 
 class UnknownAnimatible(Animatable):
@@ -146,10 +161,12 @@ class Sphere(Animatable):
     @position.setter
     def position(self, value: Optional[VectorProperty]) -> None:
         self._position = value
+        self._version += 1
 
     @position.deleter
     def position(self) -> None:
         self._position = None
+        self._version += 1
 
     @property
     def radius(self) -> ScalarProperty:
@@ -159,6 +176,7 @@ class Sphere(Animatable):
     @radius.setter
     def radius(self, value: ScalarProperty) -> None:
         self._radius = value
+        self._version += 1
 
     @property
     def color(self) -> ColorProperty:
@@ -168,10 +186,12 @@ class Sphere(Animatable):
     @color.setter
     def color(self, value: ColorProperty) -> None:
         self._color = value
+        self._version += 1
 
     @color.deleter
     def color(self) -> None:
         self._color = "black"
+        self._version += 1
 
 
 class Tube(Animatable):
@@ -230,6 +250,7 @@ class Tube(Animatable):
     @path.setter
     def path(self, value: PathLike) -> None:
         self._path = value
+        self._version += 1
 
     @property
     def radius(self) -> ScalarProperty:
@@ -239,6 +260,7 @@ class Tube(Animatable):
     @radius.setter
     def radius(self, value: ScalarProperty) -> None:
         self._radius = value
+        self._version += 1
 
     @property
     def isGrowing(self) -> bool:
@@ -251,6 +273,7 @@ class Tube(Animatable):
     @isGrowing.setter
     def isGrowing(self, value: bool) -> None:
         self._isGrowing = value
+        self._version += 1
 
     @property
     def color(self) -> ColorProperty:
@@ -260,10 +283,12 @@ class Tube(Animatable):
     @color.setter
     def color(self, value: ColorProperty) -> None:
         self._color = value
+        self._version += 1
 
     @color.deleter
     def color(self) -> None:
         self._color = "black"
+        self._version += 1
 
 
 class Line(Animatable):
@@ -328,10 +353,12 @@ class Line(Animatable):
     @start.setter
     def start(self, value: Optional[VectorProperty]) -> None:
         self._start = value
+        self._version += 1
 
     @start.deleter
     def start(self) -> None:
         self._start = None
+        self._version += 1
 
     @property
     def end(self) -> Optional[VectorProperty]:
@@ -341,10 +368,12 @@ class Line(Animatable):
     @end.setter
     def end(self, value: Optional[VectorProperty]) -> None:
         self._end = value
+        self._version += 1
 
     @end.deleter
     def end(self) -> None:
         self._end = None
+        self._version += 1
 
     @property
     def lineWidth(self) -> ScalarProperty:
@@ -354,6 +383,7 @@ class Line(Animatable):
     @lineWidth.setter
     def lineWidth(self, value: ScalarProperty) -> None:
         self._lineWidth = value
+        self._version += 1
 
     @property
     def pointForward(self) -> bool:
@@ -363,6 +393,7 @@ class Line(Animatable):
     @pointForward.setter
     def pointForward(self, value: bool) -> None:
         self._pointForward = value
+        self._version += 1
 
     @property
     def pointBackward(self) -> bool:
@@ -372,6 +403,7 @@ class Line(Animatable):
     @pointBackward.setter
     def pointBackward(self, value: bool) -> None:
         self._pointBackward = value
+        self._version += 1
 
     @property
     def color(self) -> ColorProperty:
@@ -381,10 +413,12 @@ class Line(Animatable):
     @color.setter
     def color(self, value: ColorProperty) -> None:
         self._color = value
+        self._version += 1
 
     @color.deleter
     def color(self) -> None:
         self._color = "black"
+        self._version += 1
 
 
 class Overlay(Animatable):
@@ -470,6 +504,7 @@ class Overlay(Animatable):
     @text.setter
     def text(self, value: TextLike) -> None:
         self._content = value
+        self._version += 1
 
     @property
     def position(self) -> str:
@@ -481,6 +516,7 @@ class Overlay(Animatable):
         if not value in Overlay._positions:
             raise ValueError("The value is not a valid position!")
         self._position = value
+        self._version += 1
 
     @property
     def fontSize(self) -> ScalarProperty:
@@ -490,6 +526,7 @@ class Overlay(Animatable):
     @fontSize.setter
     def fontSize(self, value: ScalarProperty) -> None:
         self._fontSize = value
+        self._version += 1
 
     @property
     def bold(self) -> bool:
@@ -499,6 +536,7 @@ class Overlay(Animatable):
     @bold.setter
     def bold(self, value: bool) -> None:
         self._bold = value
+        self._version += 1
 
     @property
     def italic(self) -> bool:
@@ -508,6 +546,7 @@ class Overlay(Animatable):
     @italic.setter
     def italic(self, value: bool) -> None:
         self._italic = value
+        self._version += 1
 
 
 class Prism(Animatable):
@@ -580,10 +619,12 @@ class Prism(Animatable):
     @position.setter
     def position(self, value: Optional[VectorProperty]) -> None:
         self._position = value
+        self._version += 1
 
     @position.deleter
     def position(self) -> None:
         self._position = None
+        self._version += 1
 
     @property
     def normal(self) -> Optional[VectorProperty]:
@@ -594,10 +635,12 @@ class Prism(Animatable):
     @normal.setter
     def normal(self, value: Optional[VectorProperty]) -> None:
         self._normal = value
+        self._version += 1
 
     @normal.deleter
     def normal(self) -> None:
         self._normal = None
+        self._version += 1
 
     @property
     def rotation(self) -> ScalarProperty:
@@ -607,6 +650,7 @@ class Prism(Animatable):
     @rotation.setter
     def rotation(self, value: ScalarProperty) -> None:
         self._rotation = value
+        self._version += 1
 
     @property
     def radius(self) -> ScalarProperty:
@@ -616,6 +660,7 @@ class Prism(Animatable):
     @radius.setter
     def radius(self, value: ScalarProperty) -> None:
         self._radius = value
+        self._version += 1
 
     @property
     def height(self) -> ScalarProperty:
@@ -625,6 +670,7 @@ class Prism(Animatable):
     @height.setter
     def height(self, value: ScalarProperty) -> None:
         self._height = value
+        self._version += 1
 
     @property
     def nVertices(self) -> int:
@@ -634,6 +680,7 @@ class Prism(Animatable):
     @nVertices.setter
     def nVertices(self, value: int) -> None:
         self._nVertices = value
+        self._version += 1
 
     @property
     def color(self) -> ColorProperty:
@@ -643,7 +690,9 @@ class Prism(Animatable):
     @color.setter
     def color(self, value: ColorProperty) -> None:
         self._color = value
+        self._version += 1
 
     @color.deleter
     def color(self) -> None:
         self._color = "black"
+        self._version += 1
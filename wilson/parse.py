@@ -13,6 +13,7 @@ from wilson.data import (
     VectorProperty,
 )
 from wilson.project import Camera, Project
+from wilson.wire import decodeGraphPoints, decodePackedDoubles, decodePathPoints, splitFields
 import wilson.proto as proto
 
 
@@ -27,6 +28,11 @@ def parseProjectFromBytes(data: bytes) -> Project:
     """
     Parses the project from the given bytes object and returns the loaded project
     """
+    # graphs and paths are decoded by ourselves, the rest is left to protobuf
+    try:
+        tables, data = splitFields(data, (2, 3))
+    except ValueError as e:
+        raise ProjectParserException(str(e))
     # ask protobuf to parse string
     project = proto.Project()
     project.ParseFromString(data)
@@ -44,9 +50,9 @@ def parseProjectFromBytes(data: bytes) -> Project:
     result.speedRatio = project.meta.speedRatio
 
     # load data; keep ids for later referencing in the properties
-    _graphs = dict(_parseGraph(g) for g in project.graphs)
+    _graphs = dict(_parseGraph(g) for g in tables[2])
     result.graphs = list(_graphs.values())
-    _paths = dict(_parsePath(p) for p in project.paths)
+    _paths = dict(_parsePath(p) for p in tables[3])
     result.paths = list(_paths.values())
 
     # parse animatables
@@ -79,27 +85,57 @@ def _parseInterpolation(intpol: proto.Interpolation.ValueType) -> Interpolation:
     return Interpolation.LINEAR
 
 
-def _parseGraph(graph: proto.Graph) -> Tuple[int, Graph]:
+def _parseColumns(data: bytes, fields: Tuple[int, ...]) -> Tuple[np.ndarray, bytes]:
+    # decodes the packed columns stored in the given fields
+    try:
+        values, data = splitFields(data, fields)
+        columns = [decodePackedDoubles(values[field]) for field in fields]
+    except ValueError as e:
+        raise ProjectParserException(str(e))
+    if any(len(c) != len(columns[0]) for c in columns):
+        raise ProjectParserException("Packed columns differ in length!")
+    return np.column_stack(columns), data
+
+
+def _parseGraph(data: memoryview) -> Tuple[int, Graph]:
+    # data
+    try:
+        array, meta = decodeGraphPoints(data)
+    except ValueError as e:
+        raise ProjectParserException(str(e))
+    columns, meta = _parseColumns(meta, (5, 6))
     # meta
+    graph = proto.Graph.FromString(meta)
     name = graph.name
     interpolation = _parseInterpolation(graph.interpolation)
-    # data
-    array = np.empty((len(graph.points), 2), dtype=np.float64)
-    for i, point in enumerate(graph.points):
-        array[i] = point.time, point.value
+    # unpacked columns are left to protobuf
+    if len(graph.time) > 0 or len(graph.value) > 0:
+        if len(graph.time) != len(graph.value):
+            raise ProjectParserException("Columns differ in length!")
+        columns = np.concatenate((columns, np.column_stack((graph.time, graph.value))))
+    array = np.concatenate((array, columns))
     # done -> return id value tuple to allow constructing a dict
     return (graph.id, Graph(array, name, interpolation))
 
 
-def _parsePath(path: proto.Path) -> Tuple[int, Path]:
+def _parsePath(data: memoryview) -> Tuple[int, Path]:
+    # data
+    try:
+        array, meta = decodePathPoints(data)
+    except ValueError as e:
+        raise ProjectParserException(str(e))
+    columns, meta = _parseColumns(meta, (5, 6, 7, 8))
     # meta
+    path = proto.Path.FromString(meta)
     name = path.name
     interpolation = _parseInterpolation(path.interpolation)
-    # data
-    array = np.empty((len(path.points), 4))
-    for i, point in enumerate(path.points):
-        p = point.position
-        array[i] = point.time, p.x, p.y, p.z
+    # unpacked columns are left to protobuf
+    unpacked = (path.time, path.x, path.y, path.z)
+    if any(len(c) > 0 for c in unpacked):
+        if any(len(c) != len(path.time) for c in unpacked):
+            raise ProjectParserException("Columns differ in length!")
+        columns = np.concatenate((columns, np.column_stack(unpacked)))
+    array = np.concatenate((array, columns))
     # done -> return id value tuple to allow constructing a dict
     return (path.id, Path(array, name, interpolation))
 
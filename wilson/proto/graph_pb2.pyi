@@ -47,6 +47,8 @@ class Graph(google.protobuf.message.Message):
     ID_FIELD_NUMBER: builtins.int
     POINTS_FIELD_NUMBER: builtins.int
     INTERPOLATION_FIELD_NUMBER: builtins.int
+    TIME_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
     name: builtins.str
     """Name as shown in explorer"""
     id: builtins.int
@@ -56,6 +58,14 @@ class Graph(google.protobuf.message.Message):
         """interpolation points"""
     interpolation: interpolation_pb2.Interpolation.ValueType
     """interpolation mode"""
+    @property
+    def time(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """interpolation points as packed columns; alternative to points
+        time coordinates
+        """
+    @property
+    def value(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """values at time"""
     def __init__(
         self,
         *,
@@ -63,7 +73,9 @@ class Graph(google.protobuf.message.Message):
         id: builtins.int = ...,
         points: collections.abc.Iterable[global___Graph.Point] | None = ...,
         interpolation: interpolation_pb2.Interpolation.ValueType = ...,
+        time: collections.abc.Iterable[builtins.float] | None = ...,
+        value: collections.abc.Iterable[builtins.float] | None = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["id", b"id", "interpolation", b"interpolation", "name", b"name", "points", b"points"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["id", b"id", "interpolation", b"interpolation", "name", b"name", "points", b"points", "time", b"time", "value", b"value"]) -> None: ...
 
 global___Graph = Graph
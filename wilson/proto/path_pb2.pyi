@@ -49,6 +49,10 @@ class Path(google.protobuf.message.Message):
     ID_FIELD_NUMBER: builtins.int
     POINTS_FIELD_NUMBER: builtins.int
     INTERPOLATION_FIELD_NUMBER: builtins.int
+    TIME_FIELD_NUMBER: builtins.int
+    X_FIELD_NUMBER: builtins.int
+    Y_FIELD_NUMBER: builtins.int
+    Z_FIELD_NUMBER: builtins.int
     name: builtins.str
     """Name as shown in explorer"""
     id: builtins.int
@@ -58,6 +62,20 @@ class Path(google.protobuf.message.Message):
         """interpolation points"""
     interpolation: interpolation_pb2.Interpolation.ValueType
     """interpolation mode"""
+    @property
+    def time(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """interpolation points as packed columns; alternative to points
+        time coordinates
+        """
+    @property
+    def x(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """x coordinates of positions"""
+    @property
+    def y(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """y coordinates of positions"""
+    @property
+    def z(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]:
+        """z coordinates of positions"""
     def __init__(
         self,
         *,
@@ -65,7 +83,11 @@ class Path(google.protobuf.message.Message):
         id: builtins.int = ...,
         points: collections.abc.Iterable[global___Path.Point] | None = ...,
         interpolation: interpolation_pb2.Interpolation.ValueType = ...,
+        time: collections.abc.Iterable[builtins.float] | None = ...,
+        x: collections.abc.Iterable[builtins.float] | None = ...,
+        y: collections.abc.Iterable[builtins.float] | None = ...,
+        z: collections.abc.Iterable[builtins.float] | None = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["id", b"id", "interpolation", b"interpolation", "name", b"name", "points", b"points"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["id", b"id", "interpolation", b"interpolation", "name", b"name", "points", b"points", "time", b"time", "x", b"x", "y", b"y", "z", b"z"]) -> None: ...
 
 global___Path = Path
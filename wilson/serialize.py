@@ -1,37 +1,171 @@
 import numpy as np
-import cmasher as cmr  # type: ignore[import]
 import re
+from functools import lru_cache
 from types import SimpleNamespace
-from typing import Any, Tuple
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from wilson.color import getColorByName
 from wilson.data import (
+    _digest,
     ColorMap,
     ColorProperty,
+    DataStats,
     Graph,
     Interpolation,
     ScalarProperty,
     Path,
+    Text,
     TextLike,
     VectorProperty,
 )
 from wilson.objects import Animatable, Line, Prism, Sphere, Tube, Overlay
 from wilson.project import Camera, Project
+from wilson.wire import (
+    encodeGraphPoints,
+    encodeMessageField,
+    encodePackedDoubles,
+    encodePathPoints,
+)
 import wilson.proto as proto
 
+T = TypeVar("T", Graph, Path)
+
+# registration of a graph or path: wrapped, table, version, position, appended
+_JournalEntry = Tuple[bool, Union[Graph, Path], int, int, bool]
+# statistics of graphs and paths by identity
+_StatsIndex = Dict[int, Tuple[Union[Graph, Path], DataStats]]
+
 # Mandatory xkcd: https://xkcd.com/1171/
 text_pattern = re.compile("%\(([^\.]+?)(?:\[(\d*?)\])?(\.[x-z])?\)(.*?[a-z])?", re.MULTILINE)
 
 
-def serializeProject(project: Project) -> bytes:
+class SerializationCache:
+    """
+    Cache of serialized animatables, graphs and paths speeding up serializing
+    the same project repeatedly, e.g. while tuning it interactively. Objects are
+    only serialized again if their version changed since the last time the
+    project was serialized with this cache. Changes made in place, e.g. to the
+    array of a graph or the groups of an animatable, are not detected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Union[_AnimatableEntry, _TableEntry]] = {}
+
+    def clear(self) -> None:
+        """Removes all cached objects."""
+        self._entries = {}
+
+
+class _AnimatableEntry(NamedTuple):
+    animatable: Animatable
+    version: int
+    name: str
+    # referenced texts with their version
+    texts: List[Tuple[Text, int]]
+    # graphs and paths registered while serializing
+    graphs: List[_JournalEntry]
+    paths: List[_JournalEntry]
+    cmapRange: Tuple[float, float]
+    chunk: bytes
+
+
+class _TableEntry(NamedTuple):
+    table: Union[Graph, Path]
+    version: int
+    id: int
+    packed: bool
+    stats: DataStats
+    chunk: bytes
+
+
+def serializeProject(
+    project: Project,
+    *,
+    packed: bool = False,
+    deduplicate: bool = False,
+    cache: Optional[SerializationCache] = None,
+) -> bytes:
     """
     Returns a bytes object containing the serialized representation of the given
-    project ready to be saved.
+    project ready to be saved. The project itself is not modified, thus it is
+    safe to serialize the same project multiple times or from multiple threads.
+
+    Parameters
+    ----------
+    project: Project
+        The project to serialize
+    packed: bool, default=False
+        If True, stores graphs and paths as packed columns, resulting in smaller
+        files. Requires a viewer supporting them.
+    deduplicate: bool, default=False
+        If True, properties assigned equal raw arrays instead of graphs or paths
+        share a single graph or path in the output.
+    cache: {SerializationCache, None}, default=None
+        If given, animatables, graphs and paths unchanged since the last time
+        the project was serialized with the same cache are not serialized again.
+    """
+    return b"".join(_serializeChunks(project, packed, deduplicate, cache))
+
+
+def writeProject(
+    project: Project, file: IO[bytes], *, packed: bool = False, deduplicate: bool = False
+) -> None:
+    """
+    Serializes the given project and writes it to the given file-like object.
+    Graphs and paths are serialized and written one at a time, thus only the
+    largest of them has to be kept in memory at once, unlike serializeProject.
+
+    Parameters
+    ----------
+    project: Project
+        The project to serialize
+    file: IO[bytes]
+        Writable file-like object the serialized project is written to
+    packed: bool, default=False
+        See serializeProject
+    deduplicate: bool, default=False
+        See serializeProject
     """
+    for chunk in _serializeChunks(project, packed, deduplicate, None):
+        file.write(chunk)
+
+
+def _serializeChunks(
+    project: Project, packed: bool, deduplicate: bool, cache: Optional[SerializationCache]
+) -> Iterator[bytes]:
     out = proto.Project()
 
+    # statistics are only carried over for tables unchanged since the last time
+    stats: _StatsIndex = {}
+    if cache is not None:
+        for key, entry in cache._entries.items():
+            if isinstance(entry, _TableEntry) and entry.version == entry.table.version:
+                stats[key] = (entry.table, entry.stats)
+
     # create serialization state
-    state = SimpleNamespace(cmapMin=float("inf"), cmapMax=float("-inf"))
+    state = SimpleNamespace(
+        # work on copies to leave the project untouched
+        graphs=_TableRegistry(list(project.graphs), deduplicate, stats),
+        paths=_TableRegistry(list(project.paths), deduplicate, stats),
+        cmapMin=float("inf"),
+        cmapMax=float("-inf"),
+        cache=cache,
+        entries={},
+        texts=None,
+    )
 
     # fill meta
     out.meta.name = project.name
@@ -54,43 +188,44 @@ def serializeProject(project: Project) -> bytes:
     nextTextId = 1
 
     # animatables
+    animatables = []
+    serialize: Callable[[Any, str, SimpleNamespace], proto.Animatible]
     for a in project.animatables:
+        # fill name if not present; leave the animatable untouched
+        name = a.name
         if isinstance(a, Sphere):
-            # fill name if not present
-            if a.name is None:
-                a.name = "Sphere " + str(nextSphereId)
+            if name is None:
+                name = "Sphere " + str(nextSphereId)
                 nextSphereId += 1
-            out.animatibles.append(_serializeSphere(a, project, state))
+            serialize = _serializeSphere
         elif isinstance(a, Line):
-            if a.name is None:
-                a.name = "Line " + str(nextLineId)
+            if name is None:
+                name = "Line " + str(nextLineId)
                 nextLineId += 1
-            out.animatibles.append(_serializeLine(a, project, state))
+            serialize = _serializeLine
         elif isinstance(a, Prism):
-            if a.name is None:
-                a.name = "Prism " + str(nextPrismId)
+            if name is None:
+                name = "Prism " + str(nextPrismId)
                 nextPrismId += 1
-            out.animatibles.append(_serializePrism(a, project, state))
+            serialize = _serializePrism
         elif isinstance(a, Tube):
-            if a.name is None:
-                a.name = "Tube " + str(nextTubeId)
+            if name is None:
+                name = "Tube " + str(nextTubeId)
                 nextTubeId += 1
-            out.animatibles.append(_serializeTube(a, project, state))
+            serialize = _serializeTube
         elif isinstance(a, Overlay):
-            if a.name is None:
-                a.name = "Label " + str(nextTextId)
+            if name is None:
+                name = "Label " + str(nextTextId)
                 nextTextId += 1
-            out.animatibles.append(_serializeOverlay(a, project))
-        # skip UnknownAnimatible
+            serialize = _serializeOverlay
+        else:
+            # skip UnknownAnimatible
+            continue
+        animatables.append(_serializeAnimatable(a, name, serialize, state))
 
     # hidden groups
     out.hiddenGroups.extend(project.hiddenGroups)
 
-    # serialize data
-    # Do this after serializing animatables as they might add implicit data
-    out.graphs.extend(_serializeGraph(graph, i) for i, graph in enumerate(project.graphs))
-    out.paths.extend(_serializePath(path, i) for i, path in enumerate(project.paths))
-
     # serialize colormap after we inferred ranges during animatable serialization
     cmapRange = project.colormapRange
     if cmapRange is None:
@@ -102,37 +237,223 @@ def serializeProject(project: Project) -> bytes:
         out.colormap.CopyFrom(_serializeColormap("viridis", cmapRange))
 
     # Fill time related stuff
-    # We need to do this after we got all paths and graphs as we might have to
-    # check them in order to get start and/or endTime
-    if project.startTime is not None:
-        out.meta.startTime = project.startTime
-    else:
-        inf = float("inf")
-        startGraph = min((g.points[0].time for g in out.graphs if len(g.points) > 0), default=inf)
-        startPath = min((p.points[0].time for p in out.paths if len(p.points) > 0), default=inf)
-        start = min(startGraph, startPath)
-        if start == inf:
-            start = 0.0
-        out.meta.startTime = start
-    if project.endTime is not None:
-        out.meta.endTime = project.endTime
-    else:
-        ninf = float("-inf")
-        endGraph = max((g.points[-1].time for g in out.graphs if len(g.points) > 0), default=ninf)
-        endPath = max((p.points[-1].time for p in out.paths if len(p.points) > 0), default=ninf)
-        end = max(endGraph, endPath)
-        if end == ninf:
-            end = 0.0
-        out.meta.endTime = end
+    # We need to do this after serializing animatables as they might add
+    # implicit data we have to check in order to get start and/or endTime
+    startTime, endTime = project.startTime, project.endTime
+    if startTime is None or endTime is None:
+        first, last = _timeRange(
+            [state.graphs.stats(g) for g in state.graphs.tables]
+            + [state.paths.stats(p) for p in state.paths.tables]
+        )
+        startTime = first if startTime is None else startTime
+        endTime = last if endTime is None else endTime
+    out.meta.startTime = startTime
+    out.meta.endTime = endTime
     out.meta.speedRatio = project.speedRatio
 
     # ask protobuf to serialize
-    return out.SerializeToString()
+    # emit the graphs (2) and paths (3) one by one between meta (1) and the
+    # remaining fields, and the animatables (16) at the end to produce the same
+    # canonical order protobuf would
+    # Graphs and paths are encoded directly into their wire format
+    yield proto.Project(meta=out.meta).SerializeToString()
+    out.ClearField("meta")
+    for i, g in enumerate(state.graphs.tables):
+        yield _serializeTable(2, g, i, _serializeGraph, state.graphs, state, packed)
+    for i, p in enumerate(state.paths.tables):
+        yield _serializeTable(3, p, i, _serializePath, state.paths, state, packed)
+    yield out.SerializeToString()
+    yield from animatables
+
+    # drop cached objects not part of the project anymore
+    if cache is not None:
+        cache._entries = state.entries
+
+
+def _serializeAnimatable(
+    animatable: Animatable,
+    name: str,
+    serialize: Callable[[Any, str, SimpleNamespace], proto.Animatible],
+    state: SimpleNamespace,
+) -> bytes:
+    if state.cache is None:
+        return encodeMessageField(16, serialize(animatable, name, state).SerializeToString())
+
+    # reuse the cached chunk if neither the animatable nor its texts changed and
+    # the graphs and paths it references end up at the same position as before
+    entry = state.cache._entries.get(id(animatable))
+    if not (
+        isinstance(entry, _AnimatableEntry)
+        and entry.animatable is animatable
+        and entry.version == animatable.version
+        and entry.name == name
+        and all(text.version == version for text, version in entry.texts)
+        and _replay(entry, state)
+    ):
+        # serialize with its own color map range to remember its contribution
+        cmapRange = state.cmapMin, state.cmapMax
+        state.cmapMin, state.cmapMax = float("inf"), float("-inf")
+        state.graphs.journal, state.paths.journal, state.texts = [], [], []
+        chunk = encodeMessageField(16, serialize(animatable, name, state).SerializeToString())
+        entry = _AnimatableEntry(
+            animatable,
+            animatable.version,
+            name,
+            state.texts,
+            state.graphs.journal,
+            state.paths.journal,
+            (state.cmapMin, state.cmapMax),
+            chunk,
+        )
+        state.graphs.journal, state.paths.journal, state.texts = None, None, None
+        state.cmapMin, state.cmapMax = cmapRange
+
+    state.entries[id(animatable)] = entry
+    state.cmapMin = min(state.cmapMin, entry.cmapRange[0])
+    state.cmapMax = max(state.cmapMax, entry.cmapRange[1])
+    return entry.chunk
+
+
+def _replay(entry: _AnimatableEntry, state: SimpleNamespace) -> bool:
+    nGraphs, nPaths = len(state.graphs.tables), len(state.paths.tables)
+    if state.graphs.replay(entry.graphs) and state.paths.replay(entry.paths):
+        return True
+    state.graphs.rollback(nGraphs)
+    state.paths.rollback(nPaths)
+    return False
 
 
 ################################## Data ########################################
 
 
+class _TableRegistry(Generic[T]):
+    """Index of a list of graphs or paths allowing to look up their position by
+    identity or content in constant time. Tables added to the registry get
+    appended to the given list. If deduplicate is True, tables wrapping raw data share
+    a single entry if their data is equal. Statistics of the tables are computed
+    at most once, either for the duration of the serialization or as long as
+    the given index is kept."""
+
+    def __init__(
+        self, tables: List[T], deduplicate: bool = False, stats: Optional[_StatsIndex] = None
+    ) -> None:
+        self._tables: List[T] = tables
+        self._ids: Dict[int, int] = {}
+        for i, table in enumerate(tables):
+            self._ids.setdefault(id(table), i)
+        # content index is build lazily as only needed for tables not found by identity
+        self._digests: Dict[bytes, List[int]] = {}
+        self._indexed = 0
+        # tables created for raw data by their content
+        self._deduplicate = deduplicate
+        self._wrapped: Dict[Tuple[bytes, Interpolation], List[int]] = {}
+        self._keys: Dict[int, Tuple[bytes, Interpolation]] = {}
+        # if not None, registrations via index() and wrap() are recorded here
+        self.journal: Optional[List[_JournalEntry]] = None
+        # arrays may be changed in place -> never trust stats cached on the tables
+        self._stats: _StatsIndex = {} if stats is None else stats
+
+    @property
+    def tables(self) -> List[T]:
+        """List of all registered tables"""
+        return self._tables
+
+    def stats(self, table: T) -> DataStats:
+        """Returns the statistics of the given table"""
+        entry = self._stats.get(id(table))
+        # identity check guards against ids reused by discarded tables
+        if entry is None or entry[0] is not table:
+            entry = self._stats[id(table)] = (table, table.stats)
+        return entry[1]
+
+    def find(self, table: T) -> Optional[int]:
+        """Returns the position of the given or an equal table or None if not
+        present."""
+        i = self._ids.get(id(table))
+        if i is not None:
+            return i
+        # update content index
+        for j in range(self._indexed, len(self._tables)):
+            self._digests.setdefault(self._tables[j].digest, []).append(j)
+        self._indexed = len(self._tables)
+        # digests may collide -> check for equality
+        for j in self._digests.get(table.digest, []):
+            if self._tables[j] == table:
+                return j
+        return None
+
+    def append(self, table: T) -> int:
+        """Appends the table and returns its position"""
+        i = len(self._tables)
+        self._tables.append(table)
+        self._ids.setdefault(id(table), i)
+        return i
+
+    def index(self, table: T) -> int:
+        """Returns the position of the given or an equal table. Appends it if not
+        present."""
+        n = len(self._tables)
+        i = self.find(table)
+        if i is None:
+            i = self.append(table)
+        self._record(False, table, i, n)
+        return i
+
+    def wrap(self, table: T) -> int:
+        """Appends a table created for raw data and returns its position. If
+        deduplicating, the position of a previously wrapped table with equal data
+        and interpolation is returned instead."""
+        n = len(self._tables)
+        i = self._wrap(table)
+        self._record(True, table, i, n)
+        return i
+
+    def _wrap(self, table: T) -> int:
+        if not self._deduplicate:
+            return self.append(table)
+        # name does not matter here
+        key = (_digest("", table.array), table.interpolation)
+        for j in self._wrapped.get(key, []):
+            if np.array_equal(self._tables[j].array, table.array):
+                return j
+        i = self.append(table)
+        self._wrapped.setdefault(key, []).append(i)
+        self._keys[i] = key
+        return i
+
+    def _record(self, wrapped: bool, table: T, i: int, n: int) -> None:
+        if self.journal is not None:
+            self.journal.append((wrapped, table, table.version, i, len(self._tables) > n))
+
+    def replay(self, journal: List[_JournalEntry]) -> bool:
+        """Repeats the recorded registrations. Returns False as soon as one
+        differs from the recorded one, in which case the registry should be
+        rolled back."""
+        for wrapped, table, version, i, appended in journal:
+            if table.version != version:
+                return False
+            n = len(self._tables)
+            j = self.wrap(table) if wrapped else self.index(table)  # type: ignore[arg-type]
+            if j != i or (len(self._tables) > n) != appended:
+                return False
+        return True
+
+    def rollback(self, n: int) -> None:
+        """Removes all tables but the first n ones"""
+        # go backwards so the removed position is always the last one in the indices
+        for j in range(len(self._tables) - 1, n - 1, -1):
+            table = self._tables[j]
+            if self._ids.get(id(table)) == j:
+                del self._ids[id(table)]
+            if j < self._indexed:
+                self._digests[table.digest].pop()
+            key = self._keys.pop(j, None)
+            if key is not None:
+                self._wrapped[key].pop()
+        del self._tables[n:]
+        self._indexed = min(self._indexed, n)
+
+
 def _serializeInterpolation(intpol: Interpolation) -> proto.Interpolation.ValueType:
     if intpol == Interpolation.LINEAR:
         return proto.Interpolation.LINEAR
@@ -146,40 +467,76 @@ def _serializeInterpolation(intpol: Interpolation) -> proto.Interpolation.ValueT
         raise ValueError("Unknown interpolation mode!")
 
 
-def _serializeGraph(graph: Graph, id: int) -> proto.Graph:
-    result = proto.Graph()
-    # meta
-    result.name = graph.name
-    result.id = id
-    result.interpolation = _serializeInterpolation(graph.interpolation)
+def _sortByTime(table: Union[Graph, Path], isSorted: bool) -> np.ndarray:
+    a = np.asarray(table.array, dtype=np.float64)
+    return a if isSorted else a[a[:, 0].argsort()]
+
+
+def _timeRange(stats: List[DataStats]) -> Tuple[float, float]:
+    # time range spanned by all tables; zero if empty
+    start = min((s.startTime for s in stats), default=float("inf"))
+    end = max((s.endTime for s in stats), default=float("-inf"))
+    return (start, end) if start <= end else (0.0, 0.0)
+
+
+def _serializeTable(
+    field: int,
+    table: T,
+    index: int,
+    serialize: Callable[[T, int, bool, bool], bytes],
+    registry: _TableRegistry[T],
+    state: SimpleNamespace,
+    packed: bool,
+) -> bytes:
+    if state.cache is None:
+        isSorted = registry.stats(table).sorted
+        return encodeMessageField(field, serialize(table, index, packed, isSorted))
+
+    # reuse the cached chunk if the table did not change and kept its position
+    entry = state.cache._entries.get(id(table))
+    if not (
+        isinstance(entry, _TableEntry)
+        and entry.table is table
+        and entry.version == table.version
+        and entry.id == index
+        and entry.packed == packed
+    ):
+        stats = registry.stats(table)
+        chunk = encodeMessageField(field, serialize(table, index, packed, stats.sorted))
+        entry = _TableEntry(table, table.version, index, packed, stats, chunk)
+
+    state.entries[id(table)] = entry
+    return entry.chunk
+
+
+def _serializeGraph(graph: Graph, id: int, packed: bool, isSorted: bool) -> bytes:
+    # meta; fields are written in order, points (3) go between id and interpolation
+    head: bytes = proto.Graph(name=graph.name, id=id).SerializeToString()
+    tail: bytes = proto.Graph(
+        interpolation=_serializeInterpolation(graph.interpolation)
+    ).SerializeToString()
     # data - sorted by time
-    a = np.array(graph.array, dtype=np.float64)
-    a = a[a[:, 0].argsort()]
-    # serialize array
-    for row in a:
-        point = result.points.add()
-        point.time = row[0]
-        point.value = row[1]
+    a = _sortByTime(graph, isSorted)
     # done
-    return result
-
-
-def _serializePath(path: Path, id: int) -> proto.Path:
-    result = proto.Path()
-    # meta
-    result.name = path.name
-    result.id = id
-    result.interpolation = _serializeInterpolation(path.interpolation)
+    if packed:
+        # columns (5, 6) follow interpolation
+        return head + tail + b"".join(encodePackedDoubles(5 + i, a[:, i]) for i in range(2))
+    return head + encodeGraphPoints(a) + tail
+
+
+def _serializePath(path: Path, id: int, packed: bool, isSorted: bool) -> bytes:
+    # meta; fields are written in order, points (3) go between id and interpolation
+    head: bytes = proto.Path(name=path.name, id=id).SerializeToString()
+    tail: bytes = proto.Path(
+        interpolation=_serializeInterpolation(path.interpolation)
+    ).SerializeToString()
     # data - sorted by time
-    a = np.array(path.array, dtype=np.float64)
-    a = a[a[:, 0].argsort()]
-    # serialize array
-    for row in a:
-        point = result.points.add()
-        point.time = row[0]
-        point.position.x, point.position.y, point.position.z = row[1:]
+    a = _sortByTime(path, isSorted)
     # done
-    return result
+    if packed:
+        # columns (5, 6, 7, 8) follow interpolation
+        return head + tail + b"".join(encodePackedDoubles(5 + i, a[:, i]) for i in range(4))
+    return head + encodePathPoints(a) + tail
 
 
 def _serializeColor(color: Tuple[Any, ...]) -> proto.Color:
@@ -206,7 +563,7 @@ def _serializeColormap(colormap: ColorMap, range: Tuple[float, float]) -> proto.
     d = range[1] - range[0]
     if isinstance(colormap, str):
         # look up color map
-        colors = cmr.take_cmap_colors(colormap, None)
+        colors = _lookupColormap(colormap)
         n = len(colors)
         stop = None
         for i, c in enumerate(colors):
@@ -240,24 +597,35 @@ def _serializeColormap(colormap: ColorMap, range: Tuple[float, float]) -> proto.
     return result
 
 
-def _serializeText(text: TextLike, objName: str, project: Project) -> str:
+@lru_cache(maxsize=32)
+def _lookupColormap(name: str) -> Tuple[Tuple[float, float, float], ...]:
+    # cmasher imports matplotlib, which is slow -> only import it when needed
+    import cmasher as cmr  # type: ignore[import]
+
+    return tuple(tuple(c) for c in cmr.take_cmap_colors(name, None))
+
+
+def _serializeText(text: TextLike, objName: str, state: SimpleNamespace) -> str:
     # plain string?
     if isinstance(text, str):
         return text
+    # remember texts for the cache
+    if state.texts is not None:
+        state.texts.append((text, text.version))
 
     # serialize data obtain list of properties (either const or global id)
     gn, pn = f".{objName}_graph ", f".{objName}_path"
     graphs = [
         (
             g.name if isinstance(g, Graph) else "",  # name (if graph)
-            _serializeScalarProperty(g, gn + str(i), project),
+            _serializeScalarProperty(g, gn + str(i), state),
         )  # scalar prop
         for i, g in enumerate(text.graphs)
     ]
     paths = [
         (
             p.name if isinstance(p, Path) else "",  # name (if path)
-            _serializeVectorProperty(p, pn + str(i), project),
+            _serializeVectorProperty(p, pn + str(i), state),
         )  # vector prop
         for i, p in enumerate(text.paths)
     ]
@@ -351,32 +719,23 @@ def _serializeText(text: TextLike, objName: str, project: Project) -> str:
 
 
 def _serializeScalarProperty(
-    scalar: ScalarProperty, name: str, project: Project
+    scalar: ScalarProperty, name: str, state: SimpleNamespace
 ) -> proto.ScalarProperty:
     result = proto.ScalarProperty()
     if isinstance(scalar, float) or isinstance(scalar, int):
         # const value
         result.constValue = float(scalar)
     elif isinstance(scalar, Graph):
-        # graph -> check if already present in project
-        #      -> Either fetch graph id or add graph
-        if scalar in project.graphs:
-            id = project.graphs.index(scalar)
-            result.graphId = id
-        else:
-            id = len(project.graphs)
-            project.graphs.append(scalar)
-            result.graphId = id
+        # graph -> Either fetch graph id or add graph
+        result.graphId = state.graphs.index(scalar)
     else:
         # scalar is path like, but not a graph -> create a new graph
-        id = len(project.graphs)
-        project.graphs.append(Graph(scalar, name))
-        result.graphId = id
+        result.graphId = state.graphs.wrap(Graph(scalar, name))
     return result
 
 
 def _serializeVectorProperty(
-    vector: VectorProperty, name: str, project: Project
+    vector: VectorProperty, name: str, state: SimpleNamespace
 ) -> proto.VectorProperty:
     result = proto.VectorProperty()
     if isinstance(vector, tuple) and len(vector) == 3:
@@ -385,25 +744,16 @@ def _serializeVectorProperty(
         result.constValue.y = vector[1]
         result.constValue.z = vector[2]
     elif isinstance(vector, Path):
-        # Check if already present in project
-        # -> Either fetch path id or add path
-        if vector in project.paths:
-            id = project.paths.index(vector)
-            result.pathId = id
-        else:
-            id = len(project.paths)
-            project.paths.append(vector)
-            result.pathId = id
+        # Either fetch path id or add path
+        result.pathId = state.paths.index(vector)
     else:
         # path like, but not a path -> create new path
-        id = len(project.paths)
-        project.paths.append(Path(vector, name))
-        result.pathId = id
+        result.pathId = state.paths.wrap(Path(vector, name))
     return result
 
 
 def _serializeColorProperty(
-    color: ColorProperty, name: str, project: Project, state: SimpleNamespace
+    color: ColorProperty, name: str, state: SimpleNamespace
 ) -> proto.ColorProperty:
     result = proto.ColorProperty()
     if isinstance(color, str):
@@ -420,27 +770,22 @@ def _serializeColorProperty(
     elif isinstance(color, tuple):
         result.constValue.CopyFrom(_serializeColor(color))
     elif isinstance(color, Graph):
-        # graph -> check if already present in project
-        #      -> Either fetch graph id or add graph
-        if color in project.graphs:
-            id = project.graphs.index(color)
-            result.graphId = id
-        else:
-            id = len(project.graphs)
-            project.graphs.append(color)
-            result.graphId = id
+        # graph -> Either fetch graph id or add graph
+        n = len(state.graphs.tables)
+        result.graphId = state.graphs.index(color)
+        if len(state.graphs.tables) > n:
             # update color map
-            state.cmapMin = min(state.cmapMin, np.min(color.array))
-            state.cmapMax = max(state.cmapMax, np.max(color.array))
+            stats = state.graphs.stats(color)
+            state.cmapMin = min(state.cmapMin, stats.minValue)
+            state.cmapMax = max(state.cmapMax, stats.maxValue)
     else:
         # color is graph like, but not a graph -> create a new graph
-        id = len(project.graphs)
         graph = Graph(color, name)
-        project.graphs.append(graph)
-        result.graphId = id
+        result.graphId = state.graphs.wrap(graph)
         # update color map
-        state.cmapMin = min(state.cmapMin, np.min(graph.array))
-        state.cmapMax = max(state.cmapMax, np.max(graph.array))
+        stats = state.graphs.stats(graph)
+        state.cmapMin = min(state.cmapMin, stats.minValue)
+        state.cmapMax = max(state.cmapMax, stats.maxValue)
     return result
 
 
@@ -483,78 +828,56 @@ def _serializeTextPosition(target: proto.Overlay, position: str) -> None:
 ################################## Objects #####################################
 
 
-def _createAnimatable(meta: Animatable, project: Project) -> proto.Animatible:
+def _createAnimatable(meta: Animatable, name: str, state: SimpleNamespace) -> proto.Animatible:
     result = proto.Animatible()
-    assert meta.name is not None
-    result.name = meta.name
+    result.name = name
     if meta.description is not None:
-        result.description = _serializeText(meta.description, result.name, project)
+        result.description = _serializeText(meta.description, result.name, state)
     if len(meta.groups) > 0:
         result.groups[:] = meta.groups
     return result
 
 
-def _serializeSphere(sphere: Sphere, project: Project, state: SimpleNamespace) -> proto.Animatible:
-    result = _createAnimatable(sphere, project)
+def _serializeSphere(sphere: Sphere, name: str, state: SimpleNamespace) -> proto.Animatible:
+    result = _createAnimatable(sphere, name, state)
     # properties
-    result.sphere.color.CopyFrom(
-        _serializeColorProperty(sphere.color, f".{sphere.name}_color", project, state)
-    )
+    result.sphere.color.CopyFrom(_serializeColorProperty(sphere.color, f".{name}_color", state))
     if sphere.position is not None:
         result.sphere.position.CopyFrom(
-            _serializeVectorProperty(sphere.position, f".{sphere.name}_position", project)
+            _serializeVectorProperty(sphere.position, f".{name}_position", state)
         )
-    result.sphere.radius.CopyFrom(
-        _serializeScalarProperty(sphere.radius, f".{sphere.name}_radius", project)
-    )
+    result.sphere.radius.CopyFrom(_serializeScalarProperty(sphere.radius, f".{name}_radius", state))
     # done
     return result
 
 
-def _serializeTube(tube: Tube, project: Project, state: SimpleNamespace) -> proto.Animatible:
-    result = _createAnimatable(tube, project)
+def _serializeTube(tube: Tube, name: str, state: SimpleNamespace) -> proto.Animatible:
+    result = _createAnimatable(tube, name, state)
     # properties
-    result.tube.color.CopyFrom(
-        _serializeColorProperty(tube.color, f".{tube.name}_color", project, state)
-    )
-    result.tube.radius.CopyFrom(
-        _serializeScalarProperty(tube.radius, f".{tube.name}_radius", project)
-    )
+    result.tube.color.CopyFrom(_serializeColorProperty(tube.color, f".{name}_color", state))
+    result.tube.radius.CopyFrom(_serializeScalarProperty(tube.radius, f".{name}_radius", state))
     result.tube.isGrowing = tube.isGrowing
     # path
     if isinstance(tube.path, Path):
-        # Check if already present in project
-        # -> Either fetch path id or add path
-        if tube.path in project.paths:
-            id = project.paths.index(tube.path)
-            result.tube.pathId = id
-        else:
-            id = len(project.paths)
-            project.paths.append(tube.path)
-            result.tube.pathId = id
+        # Either fetch path id or add path
+        result.tube.pathId = state.paths.index(tube.path)
     else:
         # path like, but not a path -> create new path
-        id = len(project.paths)
-        project.paths.append(Path(tube.path, f".{tube.name}_path"))
-        result.tube.pathId = id
+        result.tube.pathId = state.paths.wrap(Path(tube.path, f".{name}_path"))
     # done
     return result
 
 
-def _serializeLine(line: Line, project: Project, state: SimpleNamespace) -> proto.Animatible:
-    result = _createAnimatable(line, project)
+def _serializeLine(line: Line, name: str, state: SimpleNamespace) -> proto.Animatible:
+    result = _createAnimatable(line, name, state)
     # properties
-    result.line.color.CopyFrom(
-        _serializeColorProperty(line.color, f".{line.name}_color", project, state)
-    )
+    result.line.color.CopyFrom(_serializeColorProperty(line.color, f".{name}_color", state))
     if line.start is not None:
-        result.line.start.CopyFrom(
-            _serializeVectorProperty(line.start, f".{line.name}_start", project)
-        )
+        result.line.start.CopyFrom(_serializeVectorProperty(line.start, f".{name}_start", state))
     if line.end is not None:
-        result.line.end.CopyFrom(_serializeVectorProperty(line.end, f".{line.name}_end", project))
+        result.line.end.CopyFrom(_serializeVectorProperty(line.end, f".{name}_end", state))
     result.line.lineWidth.CopyFrom(
-        _serializeScalarProperty(line.lineWidth, f".{line.name}_lineWidth", project)
+        _serializeScalarProperty(line.lineWidth, f".{name}_lineWidth", state)
     )
     result.line.pointForward = line.pointForward
     result.line.pointBackward = line.pointBackward
@@ -562,42 +885,35 @@ def _serializeLine(line: Line, project: Project, state: SimpleNamespace) -> prot
     return result
 
 
-def _serializePrism(prism: Prism, project: Project, state: SimpleNamespace) -> proto.Animatible:
-    result = _createAnimatable(prism, project)
+def _serializePrism(prism: Prism, name: str, state: SimpleNamespace) -> proto.Animatible:
+    result = _createAnimatable(prism, name, state)
     # properties
-    result.prism.color.CopyFrom(
-        _serializeColorProperty(prism.color, f".{prism.name}_color", project, state)
-    )
+    result.prism.color.CopyFrom(_serializeColorProperty(prism.color, f".{name}_color", state))
     if prism.position is not None:
         result.prism.position.CopyFrom(
-            _serializeVectorProperty(prism.position, f".{prism.name}_position", project)
+            _serializeVectorProperty(prism.position, f".{name}_position", state)
         )
     if prism.normal is not None:
         result.prism.normal.CopyFrom(
-            _serializeVectorProperty(prism.normal, f".{prism.name}_normal", project)
+            _serializeVectorProperty(prism.normal, f".{name}_normal", state)
         )
     result.prism.rotation.CopyFrom(
-        _serializeScalarProperty(prism.rotation, f".{prism.name}_rotation", project)
-    )
-    result.prism.radius.CopyFrom(
-        _serializeScalarProperty(prism.radius, f".{prism.name}_radius", project)
-    )
-    result.prism.height.CopyFrom(
-        _serializeScalarProperty(prism.height, f".{prism.name}_height", project)
+        _serializeScalarProperty(prism.rotation, f".{name}_rotation", state)
     )
+    result.prism.radius.CopyFrom(_serializeScalarProperty(prism.radius, f".{name}_radius", state))
+    result.prism.height.CopyFrom(_serializeScalarProperty(prism.height, f".{name}_height", state))
     result.prism.nVertices = prism.nVertices
     # done
     return result
 
 
-def _serializeOverlay(overlay: Overlay, project: Project) -> proto.Animatible:
-    result = _createAnimatable(overlay, project)
+def _serializeOverlay(overlay: Overlay, name: str, state: SimpleNamespace) -> proto.Animatible:
+    result = _createAnimatable(overlay, name, state)
     # properties
-    assert overlay.name is not None  # redundant but keeps mypy happy
-    result.overlay.text = _serializeText(overlay.text, overlay.name, project)
+    result.overlay.text = _serializeText(overlay.text, name, state)
     _serializeTextPosition(result.overlay, overlay.position)
     result.overlay.fontSize.CopyFrom(
-        _serializeScalarProperty(overlay.fontSize, f".{overlay.name}_fontSize", project)
+        _serializeScalarProperty(overlay.fontSize, f".{name}_fontSize", state)
     )
     result.overlay.bold = overlay.bold
     result.overlay.italic = overlay.italic
@@ -1,16 +1,53 @@
-import importlib.resources
+from __future__ import annotations
+import email.utils
+import gzip
+import hashlib
+import io
+import json
 import os.path
+import re
+import struct
 import tempfile
 import threading
+import time
 import urllib.parse
-import webbrowser
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import timezone
+from email.message import Message
 from functools import partial
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Iterable, List, Optional
-from zipfile import ZipFile
-from wilson.catalogue import Catalogue, saveProject
-from wilson.project import Project
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from zipfile import BadZipFile, ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
+# Serving files does not need the object model nor numpy or protobuf
+# -> only import them when actually creating projects to keep the cli fast
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from wilson.asyncserver import AsyncHTTPServer
+    from wilson.project import Project
 
 
 def _extractPath(requestPath: str) -> str:
@@ -19,21 +56,284 @@ def _extractPath(requestPath: str) -> str:
     return urllib.parse.unquote(path)
 
 
+def _stripWeak(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+class Request(Protocol):
+    """The parts of a http request the handlers and responses look at"""
+
+    path: str
+    headers: Message
+
+
+class FileRange(NamedTuple):
+    """Part of a file to be sent as body, optionally enclosed by header and trailer"""
+
+    file: BinaryIO
+    offset: int
+    length: int
+    header: bytes = b""
+    trailer: bytes = b""
+
+
+Body = Union[bytes, FileRange, "EventStream"]
+"""
+Body of a response: Either its content, a range of a file to send or a stream of
+events lasting as long as the connection.
+"""
+
+
 class Response:
-    """Helper class for creating http responses"""
+    """Helper class for creating http responses
 
-    def __init__(self, status: int = 200, content: bytes = b"", contentType: str = "text/plain"):
+    Responses with validators, i.e. etag or lastModified, are answered with
+    304 Not Modified if the request's conditional headers match them.
+    """
+
+    def __init__(
+        self,
+        status: int = 200,
+        content: bytes = b"",
+        contentType: str = "text/plain",
+        *,
+        etag: Optional[str] = None,
+        lastModified: Optional[float] = None,
+        cacheControl: Optional[str] = None,
+        contentEncoding: Optional[str] = None,
+        vary: Optional[str] = None,
+    ):
         self.status = status
         self.content = content
         self.contentType = contentType
+        self.etag = etag
+        self.lastModified = lastModified
+        self.cacheControl = cacheControl
+        self.contentEncoding = contentEncoding
+        self.vary = vary
+
+    def isNotModified(self, request: Request) -> bool:
+        """True, if the request's conditional headers match this response."""
+        if self.status != 200:
+            return False
+        # If-None-Match takes precedence over If-Modified-Since
+        match = request.headers.get("If-None-Match")
+        if match is not None:
+            if self.etag is None:
+                return False
+            if match.strip() == "*":
+                return True
+            return _stripWeak(self.etag) in (_stripWeak(tag) for tag in match.split(","))
+        since = request.headers.get("If-Modified-Since")
+        if since is not None and self.lastModified is not None:
+            try:
+                date = email.utils.parsedate_to_datetime(since)
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            # Last-Modified only has a resolution of seconds
+            return int(self.lastModified) <= date.timestamp()
+        return False
+
+    def cacheHeaders(self) -> List[Tuple[str, str]]:
+        """Returns the validators and caching instructions"""
+        headers = []
+        if self.etag is not None:
+            headers.append(("ETag", self.etag))
+        if self.lastModified is not None:
+            headers.append(
+                ("Last-Modified", email.utils.formatdate(self.lastModified, usegmt=True))
+            )
+        if self.cacheControl is not None:
+            headers.append(("Cache-Control", self.cacheControl))
+        if self.vary is not None:
+            headers.append(("Vary", self.vary))
+        return headers
+
+    def prepare(self, request: Request) -> Tuple[int, List[Tuple[str, str]], Body]:
+        """
+        Returns status, headers and body answering the given request. Independent
+        of the server engine actually sending them.
+        """
+        if self.isNotModified(request):
+            return 304, self.cacheHeaders(), b""
+        headers = [
+            ("Content-Length", str(len(self.content))),
+            ("Content-Type", self.contentType),
+        ]
+        if self.contentEncoding is not None:
+            headers.append(("Content-Encoding", self.contentEncoding))
+        return self.status, headers + self.cacheHeaders(), self.content
+
+    def close(self) -> None:
+        """Releases resources held for sending the body"""
+        pass
 
     def send(self, handler: BaseHTTPRequestHandler, headOnly: bool = False) -> None:
-        handler.send_response(self.status)
-        handler.send_header("Content-Length", str(len(self.content)))
-        handler.send_header("Content-Type", self.contentType)
-        handler.end_headers()
-        if not headOnly:
-            handler.wfile.write(self.content)
+        try:
+            status, headers, body = self.prepare(handler)
+            handler.send_response(status)
+            for name, value in headers:
+                handler.send_header(name, value)
+            if isinstance(body, EventStream):
+                # the stream only ends with the connection
+                handler.send_header("Connection", "close")
+            handler.end_headers()
+            if headOnly:
+                return
+            if isinstance(body, EventStream):
+                self._stream(handler, body)
+            elif isinstance(body, FileRange):
+                handler.wfile.write(body.header)
+                # let the os copy the file directly into the socket
+                if body.length > 0:
+                    handler.connection.sendfile(body.file, body.offset, body.length)
+                handler.wfile.write(body.trailer)
+            else:
+                handler.wfile.write(body)
+        finally:
+            self.close()
+
+    @staticmethod
+    def _stream(handler: BaseHTTPRequestHandler, stream: EventStream) -> None:
+        try:
+            while data := stream.read(EventStream.HEARTBEAT_INTERVAL):
+                handler.wfile.write(data)
+                handler.wfile.flush()
+        except ConnectionError:
+            # viewer went away
+            pass
+
+
+# only single ranges are supported
+_RANGE_PATTERN = re.compile(r"bytes=([0-9]*)-([0-9]*)")
+
+
+def _parseRange(value: str, size: int) -> Optional[Tuple[int, int]]:
+    # returns the half open interval [start, end) or None if not supported
+    # the range is not satisfiable if start >= end
+    match = _RANGE_PATTERN.fullmatch(value.strip())
+    if match is None or match[1] == match[2] == "":
+        return None
+    if match[1] == "":
+        # suffix range: last n bytes
+        return max(size - int(match[2]), 0), size
+    start = int(match[1])
+    if match[2] == "":
+        return start, size
+    last = int(match[2])
+    if last < start:
+        # invalid -> ignore
+        return None
+    return start, min(last + 1, size)
+
+
+class FileResponse(Response):
+    """Response streaming the content of a file instead of reading it into memory.
+    Honours single range requests with 206 Partial Content.
+    """
+
+    def __init__(self, path: str, contentType: str = "application/octet-stream"):
+        self._file = open(path, mode="rb")
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        # files might change at any time -> always revalidate using mtime and size
+        super().__init__(
+            200,
+            b"",
+            contentType,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            lastModified=stat.st_mtime,
+            cacheControl="no-cache",
+        )
+
+    def _requestedRange(self, request: Request) -> Optional[Tuple[int, int]]:
+        value = request.headers.get("Range")
+        if value is None:
+            return None
+        # only send a part if the file is still the one the client has parts of
+        condition = request.headers.get("If-Range")
+        if condition is not None:
+            condition = condition.strip()
+            if condition.startswith('"') or condition.startswith("W/"):
+                # requires strong comparison
+                if condition != self.etag:
+                    return None
+            else:
+                try:
+                    date = email.utils.parsedate_to_datetime(condition)
+                except (TypeError, IndexError, OverflowError, ValueError):
+                    return None
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                if self.lastModified is None or int(self.lastModified) != date.timestamp():
+                    return None
+        return _parseRange(value, self.size)
+
+    def prepare(self, request: Request) -> Tuple[int, List[Tuple[str, str]], Body]:
+        if self.isNotModified(request):
+            return 304, self.cacheHeaders(), b""
+
+        range = self._requestedRange(request)
+        if range is not None and range[0] >= range[1]:
+            return 416, [("Content-Range", f"bytes */{self.size}"), ("Content-Length", "0")], b""
+        start, end = range if range is not None else (0, self.size)
+
+        headers = [
+            ("Content-Length", str(end - start)),
+            ("Content-Type", self.contentType),
+            ("Accept-Ranges", "bytes"),
+        ]
+        if range is not None:
+            headers.append(("Content-Range", f"bytes {start}-{end - 1}/{self.size}"))
+        status = 206 if range is not None else 200
+        return status, headers + self.cacheHeaders(), FileRange(self._file, start, end - start)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ArchiveEntryResponse(Response):
+    """Response sending an entry of a zip archive as stored, i.e. copying the
+    compressed data straight from the file instead of inflating it.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        range: FileRange,
+        *,
+        etag: str,
+        contentEncoding: Optional[str] = None,
+    ):
+        self._file = file
+        self._range = range
+        super().__init__(
+            200,
+            b"",
+            "application/octet-stream",
+            etag=etag,
+            cacheControl="no-cache",
+            contentEncoding=contentEncoding,
+            vary="Accept-Encoding",
+        )
+
+    def prepare(self, request: Request) -> Tuple[int, List[Tuple[str, str]], Body]:
+        if self.isNotModified(request):
+            return 304, self.cacheHeaders(), b""
+        length = len(self._range.header) + self._range.length + len(self._range.trailer)
+        headers = [
+            ("Content-Length", str(length)),
+            ("Content-Type", self.contentType),
+        ]
+        if self.contentEncoding is not None:
+            headers.append(("Content-Encoding", self.contentEncoding))
+        return 200, headers + self.cacheHeaders(), self._range
+
+    def close(self) -> None:
+        self._file.close()
 
 
 NOT_FOUND_HTML = b"""\
@@ -80,10 +380,34 @@ class Handler(ABC):
     """Base class for handling a request"""
 
     @abstractmethod
-    def __call__(self, handler: BaseHTTPRequestHandler) -> Optional[Response]:
+    def __call__(self, request: Request) -> Optional[Response]:
         pass
 
 
+def _negotiateEncoding(accept: Optional[str], available: Iterable[str]) -> str:
+    # returns the available encoding the client prefers; identity as fallback
+    if accept is None:
+        return "identity"
+    weights: Dict[str, float] = {}
+    for part in accept.split(","):
+        coding, _, params = part.partition(";")
+        q = 1.0
+        param, _, value = params.partition("=")
+        if param.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    best, bestWeight = "identity", 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        # ties go to the first, i.e. best compressing, encoding
+        if coding != "identity" and weight > bestWeight:
+            best, bestWeight = coding, weight
+    return best
+
+
 class AppHandler(Handler):
     """class handling look-ups for app files"""
 
@@ -96,52 +420,367 @@ class AppHandler(Handler):
         ".svg": "image/svg+xml",
     }
 
+    # types worth compressing
+    COMPRESSIBLE = {".css", ".html", ".js", ".svg"}
+
+    # file extension of precompressed variants stored next to the original
+    ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
     def __init__(self) -> None:
-        app_path = importlib.resources.files("wilson").joinpath("app.zip")  # type: ignore
-        self._app_file = app_path.open(mode="rb")
-        self._archive = ZipFile(self._app_file)
+        import importlib.resources
 
-    def __del__(self) -> None:
-        self._archive.close()
-        if not self._app_file.closed:
-            self._app_file.close()
+        # the app is small -> load and decompress it once to serve it from memory
+        app_path = importlib.resources.files("wilson").joinpath("app.zip")  # type: ignore
+        with app_path.open(mode="rb") as f, ZipFile(f) as archive:
+            contents = {
+                name: archive.read(name) for name in archive.namelist() if not name.endswith("/")
+            }
+        # immutable, thus safe to share between all request threads
+        self._files: Mapping[str, Mapping[str, Response]] = MappingProxyType(
+            {
+                name: MappingProxyType(self._createResponses(name, contents))
+                for name in contents
+                if not any(
+                    name.endswith(ext) and name[: -len(ext)] in contents
+                    for ext in AppHandler.ENCODINGS.values()
+                )
+            }
+        )
 
-    def __call__(self, handler: BaseHTTPRequestHandler) -> Optional[Response]:
-        resource = _extractPath(handler.path)
+    @staticmethod
+    def _compress(encoding: str, content: bytes) -> Optional[bytes]:
+        if encoding == "gzip":
+            return gzip.compress(content, mtime=0)
+        try:
+            import brotli  # type: ignore
+        except ImportError:
+            return None
+        result: bytes = brotli.compress(content, quality=5)
+        return result
+
+    @staticmethod
+    def _createResponses(resource: str, contents: Dict[str, bytes]) -> Dict[str, Response]:
+        content = contents[resource]
+        ext = os.path.splitext(resource)[1]
+        contentType = AppHandler.CONTENT_TYPE.get(ext, "text/plain")
+        etag = hashlib.blake2b(content, digest_size=16).hexdigest()
+        # file names of the bundled assets contain their hash -> never change
+        if resource.startswith("assets/"):
+            cacheControl = "public, max-age=31536000, immutable"
+        else:
+            cacheControl = "no-cache"
+
+        # use precompressed variants from the bundle, or create them once here
+        variants = {"identity": content}
+        if ext in AppHandler.COMPRESSIBLE:
+            for encoding, suffix in AppHandler.ENCODINGS.items():
+                compressed = contents.get(resource + suffix)
+                if compressed is None:
+                    compressed = AppHandler._compress(encoding, content)
+                if compressed is not None and len(compressed) < len(content):
+                    variants[encoding] = compressed
+        vary = "Accept-Encoding" if len(variants) > 1 else None
+
+        return {
+            encoding: Response(
+                200,
+                data,
+                contentType,
+                # each variant needs its own strong validator
+                etag=f'"{etag}"' if encoding == "identity" else f'"{etag}-{encoding}"',
+                cacheControl=cacheControl,
+                contentEncoding=None if encoding == "identity" else encoding,
+                vary=vary,
+            )
+            for encoding, data in variants.items()
+        }
+
+    def __call__(self, request: Request) -> Optional[Response]:
+        resource = _extractPath(request.path)
         # special: index.html mapped to root
         if resource == "":
             resource = "index.html"
-        # see if resource is inside the zip archive
-        if resource in self._archive.namelist():
-            ext = os.path.splitext(resource)[1]
-            contentType = AppHandler.CONTENT_TYPE.get(ext, "text/plain")
-            content = None
-            with self._archive.open(resource) as f:
-                content = f.read()
-            return Response(200, content, contentType)
+        # see if resource is inside the app
+        variants = self._files.get(resource)
+        if variants is None:
+            return None
+        return variants[_negotiateEncoding(request.headers.get("Accept-Encoding"), variants)]
+
+
+def _decodeVarint(data: bytes, pos: int) -> Tuple[int, int]:
+    # returns the value and the position after it
+    value, shift = 0, 0
+    while pos < len(data):
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        pos += 1
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise ValueError("Truncated varint!")
+
+
+# gzip header without file name and modification time
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _dataOffset(file: BinaryIO, info: ZipInfo) -> Optional[int]:
+    # returns the position of the entry's data within the zip file
+    # the local header's extra field might differ from the central one
+    file.seek(info.header_offset)
+    header = file.read(30)
+    if header[:4] != b"PK\x03\x04":
+        return None
+    nameLength, extraLength = struct.unpack("<HH", header[26:30])
+    offset: int = info.header_offset + 30 + nameLength + extraLength
+    return offset
+
+
+class _OpenCatalogue:
+    """Catalogue file opened once and shared by all requests"""
+
+    def __init__(self, path: str, stat: os.stat_result):
+        self.archive = ZipFile(path)
+        self.path = path
+        self.names = self.archive.namelist()
+        self.stat = stat
+        self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        self._metas: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def isCurrent(self, stat: os.stat_result) -> bool:
+        """True, if the file did not change since it was opened"""
+        return (stat.st_mtime_ns, stat.st_size) == (self.stat.st_mtime_ns, self.stat.st_size)
+
+    def meta(self, name: str) -> Optional[Dict[str, Any]]:
+        """Returns the meta data of the given entry or None if it is not a project"""
+        if name not in self._metas:
+            self._metas[name] = self._readMeta(name)
+        return self._metas[name]
+
+    def _readMeta(self, name: str) -> Optional[Dict[str, Any]]:
+        from google.protobuf.message import DecodeError
+        from wilson.proto import Project, ProjectMeta
+
+        # the meta data is the first field of a serialized project
+        # -> only decompress the beginning of the entry
+        meta = None
+        with self.archive.open(name) as file:
+            head = file.read(11)
+            if head[:1] == b"\x0a":
+                length, pos = _decodeVarint(head, 1)
+                data = head[pos : pos + length]
+                data += file.read(length - len(data))
+                try:
+                    meta = ProjectMeta.FromString(data)
+                except DecodeError:
+                    pass
+        if meta is None:
+            # written by someone else -> fields might be in any order
+            try:
+                meta = Project.FromString(self.archive.read(name)).meta
+            except DecodeError:
+                return None
+        return {
+            "name": meta.name,
+            "author": meta.author,
+            "date": meta.date.ToDatetime().isoformat() if meta.HasField("date") else None,
+            "description": meta.description,
+            "startTime": meta.startTime,
+            "endTime": meta.endTime,
+            "speedRatio": meta.speedRatio,
+        }
+
+
+class CatalogueEndpoints:
+    """
+    Serves the content of catalogue files without the client downloading them
+    as a whole:
+
+    - <catalogue>/index.json?offset=0&limit=100 lists the entries' names and
+      meta data as JSON page by page.
+    - <catalogue>/entries/<name> returns the serialized project of a single entry.
+
+    Opened catalogues are kept in a LRU cache so only the first request has to
+    read the catalogue's directory, making subsequent ones independent of the
+    number of entries.
+
+    Parameters
+    ----------
+    capacity: int, default=16
+        Maximum number of catalogues kept open
+    """
+
+    # entries are stored as raw deflate streams, which can be sent either wrapped
+    # as gzip or as is as deflate. Strictly, the latter expects the zlib format,
+    # but browsers accept raw streams, too.
+    ENCODINGS = ("gzip", "deflate")
+    # limit pages to keep the time of a single request bounded
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 1000
+
+    def __init__(self, capacity: int = 16):
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._catalogues: OrderedDict[str, _OpenCatalogue] = OrderedDict()
+
+    def _open(self, path: str) -> _OpenCatalogue:
+        stat = os.stat(path)
+        with self._lock:
+            catalogue = self._catalogues.get(path)
+            if catalogue is not None and catalogue.isCurrent(stat):
+                self._catalogues.move_to_end(path)
+                return catalogue
+        # open outside the lock to not block other catalogues
+        catalogue = _OpenCatalogue(path, stat)
+        with self._lock:
+            self._catalogues[path] = catalogue
+            self._catalogues.move_to_end(path)
+            # evicted catalogues get closed once the last request using them finished
+            while len(self._catalogues) > self._capacity:
+                self._catalogues.popitem(last=False)
+        return catalogue
+
+    def __call__(self, path: str, route: str, request: Request) -> Optional[Response]:
+        """Answers the request for the given route within the catalogue at path"""
+        try:
+            catalogue = self._open(path)
+        except (FileNotFoundError, BadZipFile):
+            # removed or not a catalogue (yet)
+            return None
+        if route == "index.json":
+            return self._index(catalogue, request)
+        elif route.startswith("entries/"):
+            return self._entry(catalogue, route[len("entries/") :], request)
         else:
             return None
 
+    def _index(self, catalogue: _OpenCatalogue, request: Request) -> Response:
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(request.path).query)
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(CatalogueEndpoints.DEFAULT_LIMIT)])[0])
+        except ValueError:
+            return Response(400, b"offset and limit must be integers")
+        if offset < 0 or not 0 < limit <= CatalogueEndpoints.MAX_LIMIT:
+            return Response(400, b"offset or limit out of range")
+
+        response = Response(
+            200, b"", "application/json", etag=catalogue.etag, cacheControl="no-cache"
+        )
+        if response.isNotModified(request):
+            return response
+        names = catalogue.names[offset : offset + limit]
+        index = {
+            "total": len(catalogue.names),
+            "offset": offset,
+            "limit": limit,
+            "entries": [{"name": name, "meta": catalogue.meta(name)} for name in names],
+        }
+        response.content = json.dumps(index).encode()
+        return response
+
+    def _entry(self, catalogue: _OpenCatalogue, name: str, request: Request) -> Optional[Response]:
+        try:
+            info = catalogue.archive.getinfo(name)
+        except KeyError:
+            return None
+        etag = f"{info.CRC:08x}-{info.file_size:x}"
+
+        # stored entries can be sent as is, deflated ones if the client accepts it
+        encoding = "identity"
+        if info.compress_type == ZIP_DEFLATED:
+            accept = request.headers.get("Accept-Encoding")
+            encoding = _negotiateEncoding(accept, CatalogueEndpoints.ENCODINGS)
+        canCopy = info.compress_type == ZIP_STORED or encoding != "identity"
+        # bit 0: encrypted
+        if canCopy and not info.flag_bits & 0x1:
+            suffix = f"-{encoding}" if encoding != "identity" else ""
+            variantEtag = f'"{etag}{suffix}"'
+            response = Response(etag=variantEtag, vary="Accept-Encoding")
+            if response.isNotModified(request):
+                return response
+            copied = self._copyEntry(catalogue, info, encoding, variantEtag)
+            if copied is not None:
+                return copied
+
+        response = Response(
+            200,
+            b"",
+            "application/octet-stream",
+            etag=f'"{etag}"',
+            cacheControl="no-cache",
+            vary="Accept-Encoding",
+        )
+        if response.isNotModified(request):
+            return response
+        response.content = catalogue.archive.read(info)
+        return response
+
+    @staticmethod
+    def _copyEntry(
+        catalogue: _OpenCatalogue, info: ZipInfo, encoding: str, etag: str
+    ) -> Optional[Response]:
+        # use an own file so the os can copy from it while the archive is in use
+        file = open(catalogue.path, "rb")
+        offset = None
+        # the file might have been replaced since the archive was opened
+        if catalogue.isCurrent(os.fstat(file.fileno())):
+            offset = _dataOffset(file, info)
+        if offset is None:
+            file.close()
+            return None
+
+        range = FileRange(file, offset, info.compress_size)
+        if encoding == "gzip":
+            # wrap the raw deflate stream using the checksum and size the zip stored
+            trailer = struct.pack("<II", info.CRC, info.file_size & 0xFFFFFFFF)
+            range = range._replace(header=_GZIP_HEADER, trailer=trailer)
+        contentEncoding = encoding if encoding != "identity" else None
+        return ArchiveEntryResponse(file, range, etag=etag, contentEncoding=contentEncoding)
+
 
 class DirectoryHandler(Handler):
     """Class for serving files from a directory."""
 
+    # Directories on some file systems only have a resolution of a few seconds
+    MTIME_RESOLUTION = 2_000_000_000  # ns
+
     def __init__(self, path: str):
         self._path = path
-
-    def __call__(self, handler: BaseHTTPRequestHandler) -> Optional[Response]:
-        resource = _extractPath(handler.path)
-        # refresh file list with every request
-        # only serve local files not nested ones
-        files = [f for f in os.listdir(self._path) if os.path.isfile(os.path.join(self._path, f))]
-        if resource in files:
-            path = os.path.join(self._path, resource)
-            content = None
-            with open(path, mode="rb") as f:
-                content = f.read()
-            return Response(200, content)
-        else:
-            return None
+        self._lock = threading.Lock()
+        self._files: FrozenSet[str] = frozenset()
+        self._mtime: Optional[int] = None
+        self._catalogues = CatalogueEndpoints()
+
+    def _index(self) -> FrozenSet[str]:
+        # adding, removing or renaming files changes the directory's mtime
+        # -> only list the directory again if it changed since the last time
+        mtime = os.stat(self._path).st_mtime_ns
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    # only serve local files not nested ones
+                    with os.scandir(self._path) as it:
+                        self._files = frozenset(e.name for e in it if e.is_file())
+                    # changes within the resolution of the mtime might go
+                    # unnoticed -> keep listing until the directory settled
+                    settled = time.time_ns() - mtime > DirectoryHandler.MTIME_RESOLUTION
+                    self._mtime = mtime if settled else None
+        return self._files
+
+    def __call__(self, request: Request) -> Optional[Response]:
+        resource = _extractPath(request.path)
+        if resource in self._index():
+            try:
+                return FileResponse(os.path.join(self._path, resource), "text/plain")
+            except FileNotFoundError:
+                # removed since the directory was listed
+                return None
+        # requests for the content of a catalogue
+        file, _, route = resource.partition("/")
+        if route and file in self._index():
+            return self._catalogues(os.path.join(self._path, file), route, request)
+        return None
 
 
 class FileHandler(Handler):
@@ -150,32 +789,331 @@ class FileHandler(Handler):
     def __init__(self, path: str):
         self._path = path
         self._file = os.path.basename(path)
+        self._catalogues = CatalogueEndpoints(capacity=1)
 
-    def __call__(self, handler: BaseHTTPRequestHandler) -> Optional[Response]:
-        resource = _extractPath(handler.path)
+    def __call__(self, request: Request) -> Optional[Response]:
+        resource = _extractPath(request.path)
         if resource == self._file:
-            content = None
-            with open(self._path, mode="rb") as f:
-                content = f.read()
-            return Response(200, content, "application/octet-stream")
+            return FileResponse(self._path, "application/octet-stream")
+        # requests for the content of the catalogue
+        file, _, route = resource.partition("/")
+        if route and file == self._file:
+            return self._catalogues(self._path, route, request)
+        return None
+
+
+@contextmanager
+def _atomicPath(dir: str, name: str) -> Iterator[str]:
+    """
+    Yields a temporary path in dir, that gets renamed to name once the block
+    completed, so the file is never served half written.
+    """
+    # unlike mkstemp, open honours the umask -> same permissions as other files
+    tmp = os.path.join(dir, f".{os.urandom(8).hex()}.tmp")
+    open(tmp, "xb").close()
+    try:
+        yield tmp
+        os.replace(tmp, os.path.join(dir, name))
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _writeAtomic(dir: str, name: str, data: bytes) -> None:
+    with _atomicPath(dir, name) as path:
+        with open(path, "wb") as file:
+            file.write(data)
+
+
+class MemoryStore(Handler):
+    """
+    Class serving catalogues kept in memory. Once their total size exceeds the
+    budget, the least recently used ones get evicted and, if a directory to spill
+    into is given, written there.
+
+    Parameters
+    ----------
+    budget: int
+        Maximum number of bytes kept in memory
+    spill: Optional[str], default=None
+        Directory to write evicted catalogues to. If None, they get dropped.
+    """
+
+    def __init__(self, budget: int, spill: Optional[str] = None):
+        self._budget = budget
+        self._spill = spill
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[str, Response] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of bytes currently kept in memory"""
+        return self._size
+
+    def put(self, name: str, data: bytes) -> None:
+        """Stores the serialized catalogue under the given name"""
+        if len(data) > self._budget:
+            if self._spill is None:
+                raise ValueError(f"{name} exceeds the memory budget!")
+            _writeAtomic(self._spill, name, data)
+            self.remove(name)
+            return
+
+        etag = f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+        response = Response(
+            200, data, "application/octet-stream", etag=etag, cacheControl="no-cache"
+        )
+        with self._lock:
+            old = self._responses.pop(name, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._responses[name] = response
+            self._size += len(data)
+            # pick the least recently used ones, but keep them until spilled
+            victims, size = [], self._size
+            for key, value in self._responses.items():
+                if size <= self._budget:
+                    break
+                victims.append((key, value))
+                size -= len(value.content)
+        if self._spill is not None:
+            # an older version on disk would otherwise shadow it once evicted
+            if old is None and os.path.exists(os.path.join(self._spill, name)):
+                os.remove(os.path.join(self._spill, name))
+            for key, value in victims:
+                _writeAtomic(self._spill, key, value.content)
+        with self._lock:
+            for key, value in victims:
+                # might have been replaced in the meantime
+                if self._responses.get(key) is value:
+                    del self._responses[key]
+                    self._size -= len(value.content)
+
+    def remove(self, name: str) -> None:
+        """Removes the catalogue with given name from memory, if present"""
+        with self._lock:
+            response = self._responses.pop(name, None)
+            if response is not None:
+                self._size -= len(response.content)
+
+    def __call__(self, request: Request) -> Optional[Response]:
+        resource = _extractPath(request.path)
+        with self._lock:
+            response = self._responses.get(resource)
+            if response is not None:
+                self._responses.move_to_end(resource)
+        return response
+
+
+class EventRing(Handler):
+    """
+    Class keeping the last serialized events pushed to it and serving them to
+    viewers under live/:
+
+    - live/events announces new events as Server-Sent Events, whose data is the
+      event's id. Reconnecting viewers get the ones they missed, if still kept
+      and pushed to the same ring, i.e. not before a restart of the server.
+    - live/latest returns the newest event.
+    - live/<id> returns the event with the given id, if still kept.
+
+    Memory is bounded by the capacity, as the oldest events get dropped and
+    streams only remember the id of the last event they announced.
+
+    Parameters
+    ----------
+    capacity: int, default=16
+        Number of events to keep
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._events: Deque[Tuple[int, Response]] = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self._listeners: Set[Callable[[], None]] = set()
+        self._next = 0
+        self._closed = False
+        # ids restart with the server -> make etags and stream ids unique per instance
+        self.token = f"{time.time_ns():x}"
+
+    @property
+    def latest(self) -> int:
+        """Id of the newest event, -1 if there are none"""
+        return self._next - 1
+
+    @property
+    def closed(self) -> bool:
+        """True, if no more events get pushed"""
+        return self._closed
+
+    def push(self, data: bytes) -> int:
+        """Adds the serialized event dropping the oldest one if full. Returns its id."""
+        with self._condition:
+            id = self._next
+            response = Response(
+                200,
+                data,
+                "application/octet-stream",
+                etag=f'"{self.token}-{id:x}"',
+                cacheControl="no-cache",
+            )
+            self._events.append((id, response))
+            self._next += 1
+            self._condition.notify_all()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+        return id
+
+    def close(self) -> None:
+        """Ends all streams"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def after(self, id: int) -> List[int]:
+        """Returns the ids of the events kept, that are newer than the given one"""
+        with self._condition:
+            return [key for key, _ in self._events if key > id]
+
+    def wait(self, id: int, timeout: float) -> None:
+        """Blocks until there is an event newer than the given one, the ring got
+        closed or the timeout expired."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.latest > id or self._closed, timeout)
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Registers a function called from the pushing thread on new events"""
+        with self._condition:
+            self._listeners.add(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        with self._condition:
+            self._listeners.discard(listener)
+
+    def _get(self, id: int) -> Optional[Response]:
+        with self._condition:
+            for key, response in self._events:
+                if key == id:
+                    return response
+            return None
+
+    def __call__(self, request: Request) -> Optional[Response]:
+        resource = _extractPath(request.path)
+        if not resource.startswith("live/"):
+            return None
+        route = resource[len("live/") :]
+        if route == "events":
+            return EventStreamResponse(self, request)
+        elif route == "latest":
+            return self._get(self.latest)
+        elif route.isascii() and route.isdecimal():
+            return self._get(int(route))
         else:
             return None
 
 
+class EventStream:
+    """Body of a response announcing the events of a ring as Server-Sent Events"""
+
+    # send a comment from time to time to notice closed connections
+    HEARTBEAT_INTERVAL = 15.0  # seconds
+    HEARTBEAT = b": heartbeat\n\n"
+
+    def __init__(self, ring: EventRing, last: int):
+        self._ring = ring
+        self._last = last
+
+    def poll(self) -> Optional[bytes]:
+        """
+        Returns the messages announcing the events since the last call, an empty
+        bytes if the stream ended or None if there are no new events.
+        """
+        ids = self._ring.after(self._last)
+        if ids:
+            self._last = ids[-1]
+            token = self._ring.token
+            return b"".join(f"id: {token}-{id}\ndata: {id}\n\n".encode() for id in ids)
+        return b"" if self._ring.closed else None
+
+    def read(self, timeout: float) -> bytes:
+        """
+        Blocks until there are new events and returns the messages announcing
+        them. Returns a heartbeat after the timeout and an empty bytes if the
+        stream ended.
+        """
+        self._ring.wait(self._last, timeout)
+        data = self.poll()
+        return data if data is not None else EventStream.HEARTBEAT
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Registers a function called from the pushing thread on new events"""
+        self._ring.subscribe(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        self._ring.unsubscribe(listener)
+
+
+class EventStreamResponse(Response):
+    """Response streaming new events of a ring until the connection closes"""
+
+    def __init__(self, ring: EventRing, request: Request):
+        super().__init__(200, b"", "text/event-stream", cacheControl="no-cache")
+        # resume after the last event the viewer got, otherwise start at the newest
+        # ids start at zero -> -1 announces all of them
+        last = max(ring.latest - 1, -1)
+        # ids of other rings, e.g. before the server restarted, are meaningless
+        token, _, lastId = request.headers.get("Last-Event-ID", "").strip().partition("-")
+        if token == ring.token and lastId.isascii() and lastId.isdecimal():
+            last = min(int(lastId), ring.latest)
+        self._events = EventStream(ring, last)
+
+    def prepare(self, request: Request) -> Tuple[int, List[Tuple[str, str]], Body]:
+        headers = [("Content-Type", self.contentType)] + self.cacheHeaders()
+        return 200, headers, self._events
+
+
+def _createStages(
+    path: Optional[str] = None,
+    store: Optional[MemoryStore] = None,
+    events: Optional[EventRing] = None,
+) -> List[Handler]:
+    """
+    Creates the handlers serving the app, the live events, the catalogues in the
+    given store and the given file or directory, if any. They are meant to be
+    created once per server and shared by all of its requests.
+    """
+    stages: List[Handler] = [AppHandler()]
+    if events is not None:
+        stages.append(events)
+    if store is not None:
+        stages.append(store)
+    if path is not None:
+        if os.path.isfile(path):
+            stages.append(FileHandler(path))
+        elif os.path.isdir(path):
+            stages.append(DirectoryHandler(path))
+    return stages
+
+
 class WilsonRequestHandler(BaseHTTPRequestHandler):
     """Class handling the http request for the server"""
 
+    # keep connections alive to serve all files of the app over a single one
+    # every response states its Content-Length so the client knows where it ends
+    protocol_version = "HTTP/1.1"
+    # close idle connections after some time to not block threads forever
+    timeout = 30
+    # headers and body are sent separately -> do not let them wait on each other
+    disable_nagle_algorithm = True
+
     def __init__(
-        self, *args: Any, path: Optional[str] = None, quiet: bool = False, **kwargs: Any
+        self, *args: Any, stages: Sequence[Handler] = (), quiet: bool = False, **kwargs: Any
     ) -> None:
         self._quiet = quiet
-        self._stages: List[Handler] = []
-        self._stages.append(AppHandler())
-        if path is not None:
-            if os.path.isfile(path):
-                self._stages.append(FileHandler(path))
-            elif os.path.isdir(path):
-                self._stages.append(DirectoryHandler(path))
+        self._stages = stages
 
         super().__init__(*args)
 
@@ -198,6 +1136,37 @@ class WilsonRequestHandler(BaseHTTPRequestHandler):
             super().log_message(format, *args)
 
 
+Engine = Literal["threading", "asyncio"]
+"""
+Engine serving the requests: Either a thread per connection or a single thread
+running an asyncio event loop.
+"""
+
+
+def _createServer(
+    port: int,
+    path: Optional[str],
+    *,
+    quiet: bool = False,
+    engine: Engine = "threading",
+    maxConnections: int = 256,
+    store: Optional[MemoryStore] = None,
+    events: Optional[EventRing] = None,
+) -> Union[ThreadingHTTPServer, AsyncHTTPServer]:
+    stages = _createStages(path, store, events)
+    if engine == "threading":
+        handler = partial(WilsonRequestHandler, stages=stages, quiet=quiet)
+        return ThreadingHTTPServer(("localhost", port), handler)
+    elif engine == "asyncio":
+        from wilson.asyncserver import AsyncHTTPServer
+
+        return AsyncHTTPServer(
+            ("localhost", port), stages, maxConnections=maxConnections, quiet=quiet
+        )
+    else:
+        raise ValueError(f"Unknown engine {engine}!")
+
+
 class WilsonServer:
     """Class for serving the web viewer app while dynamically managing event files.
 
@@ -217,6 +1186,21 @@ class WilsonServer:
         the OS will provide a random free one.
     quiet: bool, default=True
         If True, suppresses prints to stdout.
+    engine: Literal['threading', 'asyncio'], default='threading'
+        Engine serving the requests. 'threading' uses a thread per connection,
+        whereas 'asyncio' serves all connections from a single event loop.
+    maxConnections: int, default=256
+        Maximum number of connections served at once by the 'asyncio' engine.
+        Connections idling between requests or streaming events do not count.
+    memoryBudget: Optional[int], default=None
+        If given, new projects and catalogues are kept in memory instead of
+        being written to dir. Once their total size exceeds the budget in bytes,
+        the least recently used ones get evicted.
+    spill: bool, default=False
+        If True, projects and catalogues evicted from memory are written to dir
+        instead of being dropped.
+    liveEvents: int, default=16
+        Number of most recent events pushed via pushEvent kept for the viewers.
 
     Attributes:
     -----------
@@ -230,16 +1214,41 @@ class WilsonServer:
         URL under which the server is accessible.
     """
 
-    def __init__(self, dir: Optional[str] = None, *, port: int = 0, quiet: bool = True):
+    def __init__(
+        self,
+        dir: Optional[str] = None,
+        *,
+        port: int = 0,
+        quiet: bool = True,
+        engine: Engine = "threading",
+        maxConnections: int = 256,
+        memoryBudget: Optional[int] = None,
+        spill: bool = False,
+        liveEvents: int = 16,
+    ):
         if dir is None:
             self._tmp = tempfile.TemporaryDirectory()
             self._dir = self._tmp.name
         else:
             self._dir = dir
 
+        # created once the first project gets published in the background
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._store = None
+        if memoryBudget is not None:
+            self._store = MemoryStore(memoryBudget, self._dir if spill else None)
+        self._events = EventRing(liveEvents)
+
         # create server
-        handler = partial(WilsonRequestHandler, path=self._dir, quiet=quiet)
-        self._server = ThreadingHTTPServer(("localhost", port), handler)
+        self._server = _createServer(
+            port,
+            self._dir,
+            quiet=quiet,
+            engine=engine,
+            maxConnections=maxConnections,
+            store=self._store,
+            events=self._events,
+        )
         # run server in own thread
         self._thread = threading.Thread(
             target=lambda server: server.serve_forever(), args=(self._server,)
@@ -255,9 +1264,15 @@ class WilsonServer:
 
     def shutdown(self) -> None:
         """Shuts the server down"""
+        # end open event streams
+        self._events.close()
         if self._thread.is_alive():
             self._server.shutdown()
             self._thread.join()  # just to be safe
+            self._server.server_close()
+        if self._executor is not None:
+            # let pending publications finish in the background
+            self._executor.shutdown(wait=False)
 
     def addProject(self, project: Project, name: Optional[str] = None) -> str:
         """
@@ -278,10 +1293,9 @@ class WilsonServer:
         """
         if name is None:
             name = project.name
-        saveProject(project, os.path.join(self.dir, name))
-        return self.url + f"?cat={urllib.parse.quote(name)}"
+        return self._publish(name, [("project", project)])
 
-    def addCatalogue(self, projects: Iterable[Project], name: str) -> str:
+    def addCatalogue(self, projects: Iterable[Project], name: str, *, workers: int = 1) -> str:
         """
         Bundles a list of projects into a catalogue and adds it to the server
         under the given name. Returns the url under which the catalogue is
@@ -293,16 +1307,81 @@ class WilsonServer:
             Projects to be bundled and added
         name: str
             Name under which to save the catalogue
+        workers: int, default=1
+            Number of worker processes used to serialize the projects. See
+            Catalogue.saveMany.
 
         Returns
         -------
         URL under which the catalogue can be viewed using the web app.
         """
-        with Catalogue(os.path.join(self.dir, name), "w") as cat:
-            for p in projects:
-                cat.save(p.name, p)
+        return self._publish(name, ((p.name, p) for p in projects), workers=workers)
+
+    def addProjectAsync(
+        self, project: Project, name: Optional[str] = None
+    ) -> Tuple[str, Future[str]]:
+        """
+        Same as addProject, but serializes and publishes the project in the
+        background. Returns immediately the url under which the project will be
+        accessible, and a future resolving to the same url once it is, or to the
+        exception raised while serializing. The project must not be changed
+        before the future completed.
+        """
+        if name is None:
+            name = project.name
+        return self._publishAsync(name, [("project", project)])
+
+    def addCatalogueAsync(
+        self, projects: Iterable[Project], name: str, *, workers: int = 1
+    ) -> Tuple[str, Future[str]]:
+        """
+        Same as addCatalogue, but bundles and publishes the projects in the
+        background. Returns immediately the url under which the catalogue will be
+        accessible, and a future resolving to the same url once it is, or to the
+        exception raised while serializing. The projects must not be changed
+        before the future completed.
+        """
+        items = ((p.name, p) for p in projects)
+        return self._publishAsync(name, items, workers=workers)
+
+    def pushEvent(self, project: Project) -> str:
+        """
+        Pushes the project as newest live event, dropping the oldest one if
+        liveEvents are already kept. Viewers listening to live/events get
+        notified. Returns the url under which the event is accessible as long as
+        it is kept.
+        """
+        from wilson.serialize import serializeProject
+
+        id = self._events.push(serializeProject(project))
+        return self.url + f"live/{id}"
+
+    def _publish(self, name: str, items: Iterable[Tuple[str, Project]], workers: int = 1) -> str:
+        # bundles the projects into a catalogue and makes it available at once
+        from wilson.catalogue import Catalogue
+
+        if self._store is not None:
+            buffer = io.BytesIO()
+            with Catalogue(buffer, "w") as cat:
+                cat.saveMany(items, workers=workers)
+            self._store.put(name, buffer.getvalue())
+        else:
+            with _atomicPath(self.dir, name) as path:
+                with Catalogue(path, "w") as cat:
+                    cat.saveMany(items, workers=workers)
         return self.url + f"?cat={urllib.parse.quote(name)}"
 
+    def _publishAsync(
+        self, name: str, items: Iterable[Tuple[str, Project]], workers: int = 1
+    ) -> Tuple[str, Future[str]]:
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # a single thread publishes in order, i.e. the last one of a name wins
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="wilson-publish")
+        future = self._executor.submit(self._publish, name, items, workers)
+        return self.url + f"?cat={urllib.parse.quote(name)}", future
+
     def displayProject(
         self, project: Project, name: Optional[str] = None, *, width: int = 985, height: int = 600
     ) -> None:
@@ -382,16 +1461,23 @@ class WilsonServer:
         return f"http://localhost:{self.port}/"
 
 
-def run(port: int, path: Optional[str] = None) -> None:
+def run(
+    port: int,
+    path: Optional[str] = None,
+    *,
+    engine: Engine = "threading",
+    maxConnections: int = 256,
+) -> None:
     """
     Runs a local server hosting the web viewer app.
     Note that this function does NOT return.
     """
-    handler = partial(WilsonRequestHandler, path=path)
-    server = ThreadingHTTPServer(("localhost", port), handler)
+    server = _createServer(port, path, engine=engine, maxConnections=maxConnections)
     port = server.server_port
     print(f"Started server at location: http://localhost:{port}/")
     if path is not None and os.path.isfile(path):
+        import webbrowser
+
         filename = os.path.basename(path)
         filename = urllib.parse.quote(filename)
         url = f"http://localhost:{port}/?cat={filename}"
@@ -422,6 +1508,18 @@ def cli_main() -> None:
     parser.add_argument(
         "--port", "-p", action="store", default=0, type=int, nargs="?", help="Specify explicit port"
     )
+    parser.add_argument(
+        "--engine",
+        choices=["threading", "asyncio"],
+        default="threading",
+        help="Serve connections with a thread each or from a single asyncio event loop",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=256,
+        help="Maximum number of connections served at once by the asyncio engine",
+    )
     parser.add_argument(
         "path",
         nargs="?",
@@ -431,7 +1529,7 @@ def cli_main() -> None:
     )
     args = parser.parse_args()
 
-    run(args.port, args.path)
+    run(args.port, args.path, engine=args.engine, maxConnections=args.max_connections)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,351 @@
+"""
+Low level helpers for encoding table data directly into the protobuf wire format
+and back, bypassing the creation of a message object per control point.
+"""
+
+import numpy as np
+from typing import Collection, Dict, List, Optional, Tuple, Union
+
+# wire types
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+
+
+def _tag(field: int, wireType: int) -> int:
+    return (field << 3) | wireType
+
+
+def encodeVarint(value: int) -> bytes:
+    """Encodes the given non negative integer as protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def encodeMessageField(field: int, message: bytes) -> bytes:
+    """Encodes the serialized message as length delimited field with the given
+    field number, i.e. as it would appear inside its parent message."""
+    return encodeVarint(_tag(field, _LENGTH_DELIMITED)) + encodeVarint(len(message)) + message
+
+
+def _asLittleEndian(array: np.ndarray, columns: int) -> np.ndarray:
+    a = np.ascontiguousarray(array, dtype="<f8")
+    if len(a.shape) != 2 or a.shape[1] != columns:
+        raise ValueError(f"The array must be of shape (N,{columns})!")
+    return a
+
+
+def encodeGraphPoints(array: np.ndarray) -> bytes:
+    """Encodes the rows (time, value) of the given array as repeated field
+    `points` of a Graph message. The output is byte identical to adding each
+    row as Graph.Point to the message and serializing it.
+
+    Parameters
+    ----------
+    array: np.ndarray of shape (N,2)
+        Control points in the order they should be encoded
+    """
+    a = _asLittleEndian(array, 2)
+    n = len(a)
+    if n == 0:
+        return b""
+    # proto3 omits fields whose bits are all zero (but keeps -0.0)
+    nonzero = a.view("<u8") != 0
+    data = a.view(np.uint8)
+
+    # full layout of a single point: tag, len, (tag, time), (tag, value)
+    buf = np.empty((n, 20), dtype=np.uint8)
+    buf[:, 0] = _tag(3, _LENGTH_DELIMITED)
+    buf[:, 1] = 9 * nonzero.sum(axis=1)
+    buf[:, 2] = _tag(1, _FIXED64)
+    buf[:, 3:11] = data[:, 0:8]
+    buf[:, 11] = _tag(2, _FIXED64)
+    buf[:, 12:20] = data[:, 8:16]
+
+    # fast path: nothing to strip
+    if nonzero.all():
+        return buf.tobytes()
+    mask = np.ones((n, 20), dtype=bool)
+    mask[:, 2:11] = nonzero[:, 0:1]
+    mask[:, 11:20] = nonzero[:, 1:2]
+    return buf[mask].tobytes()
+
+
+def encodePathPoints(array: np.ndarray) -> bytes:
+    """Encodes the rows (time, x, y, z) of the given array as repeated field
+    `points` of a Path message. The output is byte identical to adding each row
+    as Path.Point to the message and serializing it.
+
+    Parameters
+    ----------
+    array: np.ndarray of shape (N,4)
+        Control points in the order they should be encoded
+    """
+    a = _asLittleEndian(array, 4)
+    n = len(a)
+    if n == 0:
+        return b""
+    nonzero = a.view("<u8") != 0
+    data = a.view(np.uint8)
+
+    # full layout of a single point:
+    # tag, len, (tag, time), (tag, len, (tag, x), (tag, y), (tag, z))
+    positionLength = 9 * nonzero[:, 1:].sum(axis=1)
+    buf = np.empty((n, 40), dtype=np.uint8)
+    buf[:, 0] = _tag(3, _LENGTH_DELIMITED)
+    buf[:, 1] = 9 * nonzero[:, 0] + 2 + positionLength
+    buf[:, 2] = _tag(1, _FIXED64)
+    buf[:, 3:11] = data[:, 0:8]
+    buf[:, 11] = _tag(2, _LENGTH_DELIMITED)
+    buf[:, 12] = positionLength
+    buf[:, 13] = _tag(1, _FIXED64)
+    buf[:, 14:22] = data[:, 8:16]
+    buf[:, 22] = _tag(2, _FIXED64)
+    buf[:, 23:31] = data[:, 16:24]
+    buf[:, 31] = _tag(3, _FIXED64)
+    buf[:, 32:40] = data[:, 24:32]
+
+    # fast path: nothing to strip
+    if nonzero.all():
+        return buf.tobytes()
+    mask = np.ones((n, 40), dtype=bool)
+    mask[:, 2:11] = nonzero[:, 0:1]
+    mask[:, 13:22] = nonzero[:, 1:2]
+    mask[:, 22:31] = nonzero[:, 2:3]
+    mask[:, 31:40] = nonzero[:, 3:4]
+    return buf[mask].tobytes()
+
+
+def _readVarint(data: memoryview, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated message!")
+        b = data[pos]
+        result |= (b & 0x7F) << shift
+        pos += 1
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _skipField(data: memoryview, pos: int, wireType: int) -> int:
+    # returns the position after the field's value
+    if wireType == 0:
+        return _readVarint(data, pos)[1]
+    elif wireType == 1:
+        end = pos + 8
+    elif wireType == 2:
+        length, pos = _readVarint(data, pos)
+        end = pos + length
+    elif wireType == 5:
+        end = pos + 4
+    else:
+        raise ValueError("Unsupported wire type!")
+    if end > len(data):
+        raise ValueError("Truncated message!")
+    return end
+
+
+def splitFields(
+    data: Union[bytes, memoryview], fields: Collection[int]
+) -> Tuple[Dict[int, List[memoryview]], bytes]:
+    """Splits the serialized message into the values of the given length
+    delimited fields and the remaining message without them.
+
+    Returns
+    -------
+    Dictionary mapping each requested field number onto the list of its values
+    in order of appearance, and the bytes of all other fields.
+    """
+    view = memoryview(data)
+    result: Dict[int, List[memoryview]] = {field: [] for field in fields}
+    rest = bytearray()
+    pos = 0
+    while pos < len(view):
+        tag, start = _readVarint(view, pos)
+        field, wireType = tag >> 3, tag & 7
+        end = _skipField(view, start, wireType)
+        if field in result and wireType == _LENGTH_DELIMITED:
+            length, start = _readVarint(view, start)
+            result[field].append(view[start:end])
+        else:
+            rest += view[pos:end]
+        pos = end
+    return result, bytes(rest)
+
+
+def _locateDoubles(
+    data: memoryview, pos: int, end: int, out: List[Optional[int]], column: int
+) -> None:
+    # stores the position of the double field i in out[column + i - 1]
+    # nested messages are flattened, i.e. their fields continue the numbering
+    while pos < end:
+        tag, start = _readVarint(data, pos)
+        field, wireType = tag >> 3, tag & 7
+        pos = _skipField(data, start, wireType)
+        if pos > end:
+            raise ValueError("Truncated message!")
+        index = column + field - 1
+        if wireType == _FIXED64 and index < len(out):
+            out[index] = start
+        elif wireType == _LENGTH_DELIMITED and index < len(out):
+            length, start = _readVarint(data, start)
+            _locateDoubles(data, start, pos, out, index)
+
+
+class _PointLayout:
+    """Byte layout of an encoded point, i.e. its structural bytes (tags and
+    lengths) and where to find the values of each column."""
+
+    def __init__(self, data: memoryview, pos: int, end: int, columns: int) -> None:
+        # derive layout from the point stored in data[pos:end]
+        length, start = _readVarint(data, pos + 1)
+        offsets: List[Optional[int]] = [None] * columns
+        _locateDoubles(data, start, end, offsets, 0)
+        # offsets relative to the point's start; None if omitted, i.e. zero
+        self.offsets = [None if o is None else o - pos for o in offsets]
+        self.size = end - pos
+        valueBytes = {o + i for o in self.offsets if o is not None for i in range(8)}
+        self.signature = [(i, data[pos + i]) for i in range(self.size) if i not in valueBytes]
+
+    def match(self, buf: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """Returns a mask of the points starting at starts sharing this layout"""
+        mask = np.ones(len(starts), dtype=bool)
+        for offset, value in self.signature:
+            mask &= buf[starts + offset] == value
+        return mask
+
+    def extract(self, doubles: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """Extracts the values of the points starting at starts"""
+        values = np.zeros((len(starts), len(self.offsets)), dtype=np.float64)
+        for column, offset in enumerate(self.offsets):
+            if offset is not None:
+                values[:, column] = doubles[starts + offset]
+        return values
+
+
+def _findPoints(buf: np.ndarray, pos: int) -> np.ndarray:
+    # Returns the start of all consecutive points beginning at pos.
+    # Any tag of a point with a single byte length is a candidate. Candidates
+    # point to the next one by skipping the point's length. Only the chain
+    # starting at pos are actual points; false candidates inside the values may
+    # form chains of their own, possibly spanning all points.
+    region = buf[pos:]
+    candidates = np.flatnonzero((region[:-1] == _tag(3, _LENGTH_DELIMITED)) & (region[1:] < 0x80))
+    if len(candidates) == 0 or candidates[0] != 0:
+        return candidates[:0]
+    successors = candidates + 2 + region[candidates + 1]
+    alive = successors <= len(region)
+    if not alive[0]:
+        return candidates[:0]
+    # index of the successor; len(candidates) if there is none
+    nextIdx = np.searchsorted(candidates, successors)
+    found = nextIdx < len(candidates)
+    found[found] = candidates[nextIdx[found]] == successors[found]
+    nextIdx[~found] = len(candidates)
+    # collect the chain starting at the first candidate by pointer doubling:
+    # after k passes, reached holds the first 2^k links and jump skips 2^k links
+    # -> takes log N passes even if false chains span all points
+    jump = np.append(nextIdx, len(candidates))
+    reached = np.zeros(len(candidates) + 1, dtype=bool)
+    reached[0] = True
+    chain = np.array([0])
+    while True:
+        links = jump[chain]
+        links = links[~reached[links]]
+        if len(links) == 0:
+            break
+        reached[links] = True
+        chain = np.concatenate((chain, links))
+        jump = jump[jump]
+    points: np.ndarray = candidates[reached[:-1]] + pos
+    return points
+
+
+def _decodePoints(data: Union[bytes, memoryview], columns: int) -> Tuple[np.ndarray, bytes]:
+    view = memoryview(data)
+    buf = np.frombuffer(view, dtype=np.uint8)
+    # unaligned view of a double starting at every byte
+    doubles = np.ndarray((max(len(buf) - 7, 0),), dtype="<f8", buffer=view, strides=(1,))
+    chunks: List[np.ndarray] = []
+    rest = bytearray()
+
+    pos = 0
+    while pos < len(view):
+        tag, start = _readVarint(view, pos)
+        end = _skipField(view, start, tag & 7)
+        if tag != _tag(3, _LENGTH_DELIMITED):
+            # not a point
+            rest += view[pos:end]
+            pos = end
+            continue
+
+        starts = _findPoints(buf, pos)
+        if len(starts) == 0:
+            # e.g. point with multi byte length -> decode on its own
+            layout = _PointLayout(view, pos, end, columns)
+            chunks.append(layout.extract(doubles, np.array([pos])))
+            pos = end
+            continue
+
+        # group points by their layout, e.g. omitted zero fields, and decode in bulk
+        values = np.empty((len(starts), columns), dtype=np.float64)
+        sizes = buf[starts + 1].astype(np.intp) + 2
+        pending = np.ones(len(starts), dtype=bool)
+        while pending.any():
+            first = starts[np.argmax(pending)]
+            layout = _PointLayout(view, first, first + 2 + buf[first + 1], columns)
+            candidates = np.flatnonzero(pending & (sizes == layout.size))
+            group = candidates[layout.match(buf, starts[candidates])]
+            values[group] = layout.extract(doubles, starts[group])
+            pending[group] = False
+        chunks.append(values)
+        pos = int(starts[-1] + sizes[-1])
+
+    if len(chunks) == 0:
+        return np.empty((0, columns), dtype=np.float64), bytes(rest)
+    return np.concatenate(chunks), bytes(rest)
+
+
+def decodeGraphPoints(data: Union[bytes, memoryview]) -> Tuple[np.ndarray, bytes]:
+    """Decodes the points of a serialized Graph message into an array of shape
+    (N,2) with the columns time, value.
+
+    Returns
+    -------
+    The decoded array and the bytes of the remaining fields of the message.
+    """
+    return _decodePoints(data, 2)
+
+
+def decodePathPoints(data: Union[bytes, memoryview]) -> Tuple[np.ndarray, bytes]:
+    """Decodes the points of a serialized Path message into an array of shape
+    (N,4) with the columns time, x, y, z.
+
+    Returns
+    -------
+    The decoded array and the bytes of the remaining fields of the message.
+    """
+    return _decodePoints(data, 4)
+
+
+def encodePackedDoubles(field: int, values: np.ndarray) -> bytes:
+    """Encodes the given values as packed repeated double field."""
+    if len(values) == 0:
+        return b""
+    data = np.ascontiguousarray(values, dtype="<f8").tobytes()
+    return encodeMessageField(field, data)
+
+
+def decodePackedDoubles(values: List[memoryview]) -> np.ndarray:
+    """Decodes the values of a packed repeated double field as returned by
+    splitFields."""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.float64)
+    columns = [np.frombuffer(v, dtype="<f8") for v in values]
+    return np.concatenate(columns).astype(np.float64)